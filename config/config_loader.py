@@ -5,7 +5,7 @@ Responsible for reading and parsing YAML configuration files, handling default v
 
 import os
 import sys
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, TYPE_CHECKING
 from dataclasses import dataclass, field
 from pathlib import Path
 import yaml
@@ -17,6 +17,9 @@ sys.path.insert(0, str(project_root))
 from utils.logger import get_logger
 from utils.exceptions import ConfigurationError
 
+if TYPE_CHECKING:
+    from core.models import EngineType
+
 
 @dataclass 
 class GlobalConfig:
@@ -44,7 +47,7 @@ class SchedulerConfig:
     metrics_fetch_interval: int = 1000
 
 
-@dataclass
+@dataclass(slots=True)
 class ModeConfig:
     """Algorithm mode configuration"""
     name: str = "s1"
@@ -110,6 +113,8 @@ class PoolConfig:
     name: str = ""
     partition: str = "Common"
     engine_type: str = ""
+    # EngineType resolved once from engine_type when the configuration is loaded
+    engine_type_enum: Optional["EngineType"] = field(default=None, compare=False, repr=False)
     fallback: FallbackConfig = field(default_factory=FallbackConfig)
     metrics: MetricsConfig = field(default_factory=MetricsConfig)
     model_APIkey: Optional[ModelApiKeyConfig] = None  # Only for XInference engine type
@@ -331,6 +336,9 @@ class ConfigLoader:
                 f"For vllm variants (vllm_ascend, vllm_musa, etc.), use 'vllm' as engine_type "
                 f"and configure the variant in 'engines_metrics_keys' section."
             )
+        # Imported here: core imports this module for ModeConfig
+        from core.models import EngineType
+        pool.engine_type_enum = EngineType(pool.engine_type.lower())
         
         # Optional configuration
         pool.partition = pool_data.get('partition', 'Common')
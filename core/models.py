@@ -3,7 +3,9 @@ Data model definition module
 Defines core data structures used by the scheduler
 """
 
-from typing import Dict, List, Optional, Any
+import itertools
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, NamedTuple, Tuple
 from enum import Enum
 
 
@@ -14,16 +16,30 @@ class EngineType(Enum):
     XINFERENCE = "xinference"
 
 
+class MetricsRecord(NamedTuple):
+    """Scoring metrics of a member, extracted once when metrics are assigned
+    
+    Fields are None when the metric is missing from the fetched data.
+    """
+    waiting_queue: Optional[float]
+    cache_usage: Optional[float]
+    running_req: Optional[float]
+
+
+# Unique stamp per metrics change, lets scoring detect unchanged metrics cheaply
+_metrics_stamps = itertools.count()
+
+
 class PoolMember:
     """Pool member data model"""
-    __slots__ = ("ip", "port", "partition", "metrics", "score", "model_metrics", 
+    __slots__ = ("ip", "port", "partition", "_metrics", "metrics_record", "metrics_stamp", "score", "model_metrics", 
                  "model_scores", "metrics_key_cache", "detected_variant")
     
     def __init__(self, ip: str, port: int, partition: str):
         self.ip: str = ip
         self.port: int = port
         self.partition: str = partition
-        self.metrics: Dict[str, float] = {}  # For vLLM/SGLang prometheus metrics
+        self.metrics = {}  # For vLLM/SGLang prometheus metrics (read-only view, see property)
         self.model_metrics: Dict[str, float] = {}  # For XInference model-level metrics: {model_name: throughput_utilization}
         self.model_scores: Dict[str, float] = {}  # For XInference precomputed model scores: {model_name: score}
         # Initialize to a small positive number to avoid all members being filtered out in initial state
@@ -35,6 +51,37 @@ class PoolMember:
         # Detected variant name for this member (e.g., "vllm_ascend", "vllm", "sglang_xxx")
         self.detected_variant: Optional[str] = None
     
+    @property
+    def metrics(self) -> Mapping[str, float]:
+        """Raw metrics for vLLM/SGLang prometheus metrics, as a read-only view
+        
+        In-place edits raise TypeError, since they would bypass metrics_record
+        and metrics_stamp; assign a new dict instead.
+        """
+        return self._metrics
+    
+    @metrics.setter
+    def metrics(self, value: Mapping[str, float]) -> None:
+        """Set metrics and refresh the typed record used by score calculation
+        
+        The values are copied, so later changes to the caller's dict do not
+        leak in either. Assigning values equal to the current ones keeps
+        metrics_stamp, so a member re-polled with unchanged metrics (e.g. an
+        idle engine) still counts as unchanged for scoring.
+        """
+        if not isinstance(value, MappingProxyType):
+            value = MappingProxyType(dict(value))
+        if value == getattr(self, "_metrics", None):
+            return
+        self._metrics = value
+        self.metrics_stamp = next(_metrics_stamps)
+        if value:
+            self.metrics_record = MetricsRecord(
+                value.get("waiting_queue"), value.get("cache_usage"), value.get("running_req")
+            )
+        else:
+            self.metrics_record = None
+    
     def metric_uri(self, schema: str, path: str, metrics_port: Optional[int] = None) -> str:
         """Construct metrics interface URI
         
@@ -181,9 +228,9 @@ class Pool:
         for member in self.members:
             member.clear_metrics_key_cache()
     
-    def get_pool_key(self) -> str:
+    def get_pool_key(self) -> "PoolKey":
         """Get Pool's unique identifier"""
-        return f"{self.name}:{self.partition}"
+        return (self.name, self.partition)
     
     def find_member(self, ip: str, port: int) -> Optional[PoolMember]:
         """Find specified member"""
@@ -211,8 +258,11 @@ class Pool:
         return [member for member in self.members if member.has_model(model_name)]
 
 
-# Global memory: pool name → Pool object
-POOLS: Dict[str, Pool] = {}
+# Pool identifier: (name, partition)
+PoolKey = Tuple[str, str]
+
+# Global memory: (pool name, partition) → Pool object
+POOLS: Dict[PoolKey, Pool] = {}
 
 
 # ============================================================================
@@ -381,8 +431,12 @@ def get_candidates_summary() -> Dict[str, Dict[str, int]]:
 
 def get_pool_by_key(pool_name: str, partition: str) -> Optional[Pool]:
     """Get Pool object by pool name and partition"""
-    key = f"{pool_name}:{partition}"
-    return POOLS.get(key)
+    return POOLS.get((pool_name, partition))
+
+
+def format_pool_key(pool_key: PoolKey) -> str:
+    """Format a Pool key as "name:partition" for display"""
+    return "%s:%s" % pool_key
 
 
 def add_or_update_pool(pool: Pool) -> None:
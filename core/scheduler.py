@@ -390,7 +390,7 @@ class Scheduler:
                 "port": member.port,
                 "score": member.score,
                 "percent": round(percent, 2),  # Keep 2 decimal places
-                "metrics": member.metrics,
+                "metrics": dict(member.metrics),
                 "detected_variant": member.detected_variant  # Detected engine variant (e.g., vllm_ascend, vllm, sglang_xxx)
             }
             status["members"].append(member_info)
@@ -3,8 +3,17 @@ Score calculation module
 Responsible for calculating member scores based on metrics
 """
 
+import heapq
+import logging
 import math
-from typing import Dict, List, Optional, Tuple
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 import sys
 from pathlib import Path
@@ -13,85 +22,392 @@ sys.path.insert(0, str(project_root))
 
 from utils.logger import get_logger
 from utils.exceptions import ScoreCalculationError
-from core.models import Pool, PoolMember, EngineType
+from core.models import Pool, PoolMember, EngineType, MetricsRecord
 from config.config_loader import ModeConfig
 
 
+def _metric_matrix(columns, work: Optional[np.ndarray] = None) -> np.ndarray:
+    """Stack per-member metric sequences as the rows of a (k, n) float64 matrix
+    
+    Args:
+        columns: k equally long metric sequences
+        work: Optional preallocated buffer of at least k * n elements to fill
+    """
+    k, n = len(columns), len(columns[0])
+    matrix = np.empty((k, n), dtype=np.float64) if work is None else work[:k * n].reshape(k, n)
+    for row, values in zip(matrix, columns):
+        row[...] = values
+    return matrix
+
+
+def _s1_score_kernel(waiting, cache, w_a: float, w_b: float, clip: bool = True,
+                     out: Optional[np.ndarray] = None, work: Optional[np.ndarray] = None):
+    """Weighted two-metric score: w_a * (1 - waiting) + w_b * (1 - cache)
+    
+    Runs on whole float64 arrays so the arithmetic executes inside NumPy's C
+    loops, which release the GIL, instead of per-member Python bytecode: the
+    metrics are stacked into one matrix and the weighted sum is taken as
+    (w_a + w_b) - [w_a, w_b] @ M, a single matrix-vector product.
+    Pools of one or two members (the common case) are computed with plain
+    floats instead, where NumPy call overhead would dominate the math, and
+    returned as an array like the vectorized path.
+    
+    Args:
+        waiting: Normalized (or raw) waiting queue values
+        cache: Normalized (or raw) cache usage values
+        w_a: Weight for waiting queue term
+        w_b: Weight for cache usage term
+        clip: Clamp scores into [0, 1]
+        out: Optional preallocated buffer receiving the scores
+        work: Optional preallocated scratch buffer for the metric matrix
+        
+    Returns:
+        float64 score array aligned with the inputs, whatever the pool size
+    """
+    if len(waiting) <= 2:
+        scores = []
+        for w, c in zip(waiting, cache):
+            score = float(w_a * (1.0 - w) + w_b * (1.0 - c))
+            if clip:
+                # Comparison form keeps NaN intact for the finiteness check
+                score = 0.0 if score < 0.0 else 1.0 if score > 1.0 else score
+            scores.append(score)
+        return np.array(scores, dtype=np.float64)
+    
+    matrix = _metric_matrix((waiting, cache), work)
+    scores = np.dot(np.array((w_a, w_b)), matrix, out=out)
+    np.subtract(w_a + w_b, scores, out=scores)
+    if clip:
+        np.clip(scores, 0.0, 1.0, out=scores)
+    return scores
+
+
+def _s2_score_kernel(waiting, cache, running, w_a: float, w_b: float, w_g: float,
+                     out: Optional[np.ndarray] = None, work: Optional[np.ndarray] = None):
+    """Weighted three-metric score clamped to [0, 1]:
+    w_a * (1 - waiting) + w_b * (1 - cache) + w_g * (1 - running)
+    
+    Same evaluation strategy as _s1_score_kernel with the running request term added.
+    """
+    if len(waiting) <= 2:
+        scores = []
+        for w, c, r in zip(waiting, cache, running):
+            score = float(w_a * (1.0 - w) + w_b * (1.0 - c) + w_g * (1.0 - r))
+            scores.append(0.0 if score < 0.0 else 1.0 if score > 1.0 else score)
+        return np.array(scores, dtype=np.float64)
+    
+    matrix = _metric_matrix((waiting, cache, running), work)
+    scores = np.dot(np.array((w_a, w_b, w_g)), matrix, out=out)
+    np.subtract(w_a + w_b + w_g, scores, out=scores)
+    np.clip(scores, 0.0, 1.0, out=scores)
+    return scores
+
+
+def _complement_power(values: np.ndarray, exponent: float) -> np.ndarray:
+    """(1 - values) ** exponent, computed in place
+    
+    The default exponent 2.0 is evaluated as a square instead of pow().
+    """
+    np.subtract(1.0, values, out=values)
+    if exponent == 2.0:
+        np.multiply(values, values, out=values)
+    else:
+        np.power(values, exponent, out=values)
+    return values
+
+
+def _coefficient_of_variation(values: np.ndarray) -> float:
+    """Population coefficient of variation (std / mean) of a collected metric array
+    
+    Mean and squared deviations are reduced in C over the contiguous array
+    produced by metric collection, instead of two Python generator passes.
+    Returns 0.0 for fewer than two values or a zero mean.
+    """
+    n = len(values)
+    if n <= 1:
+        return 0.0
+    mean = float(values.sum()) / n
+    if mean == 0:
+        return 0.0
+    deviations = values - mean
+    return math.sqrt(float(deviations.dot(deviations)) / n) / mean
+
+
+def _abs_coefficient_of_variation(values: np.ndarray) -> float:
+    """Coefficient of variation relative to |mean|, as used by the advanced modes
+    
+    Returns 0.0 for fewer than two values or a near-zero mean (|mean| < 1e-6).
+    """
+    n = len(values)
+    if n <= 1:
+        return 0.0
+    mean = float(values.sum()) / n
+    if abs(mean) < 1e-6:
+        return 0.0
+    deviations = values - mean
+    return math.sqrt(float(deviations.dot(deviations)) / n) / abs(mean)
+
+
+def _row_statistics(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Population statistics of each row of a (k, n) metric matrix
+    
+    Returns:
+        (means, deviations, std_devs, cvs); std_dev is 1e-6 for rows without
+        positive variance, and cv falls back to std_dev when |mean| <= 1e-6
+    """
+    n = matrix.shape[1]
+    means = matrix.sum(axis=1) / n
+    # 中心化偏差只计算一次，方差、偏度和z-score共用
+    deviations = matrix - means[:, None]
+    variances = np.einsum("ij,ij->i", deviations, deviations) / n
+    std_devs = np.sqrt(variances)
+    std_devs[~(variances > 0)] = 1e-6
+    
+    # 计算变异系数 (Coefficient of Variation)
+    cvs = std_devs.copy()
+    abs_means = np.abs(means)
+    nonzero = abs_means > 1e-6
+    cvs[nonzero] /= abs_means[nonzero]
+    return means, deviations, std_devs, cvs
+
+
+def _distribution_stats_line(metric_type: str, mean_val: float, deviations: np.ndarray,
+                             std_dev: float, cv: float) -> str:
+    """Debug line describing one metric's distribution, including its skewness"""
+    # 计算偏度 (Skewness) - 衡量数据分布的对称性，仅用于调试日志
+    skewness = float(((deviations / std_dev) ** 3).mean()) if std_dev > 1e-6 else 0.0
+    return f"Distribution stats for {metric_type}: mean={mean_val:.3f}, std={std_dev:.3f}, cv={cv:.3f}, skew={skewness:.3f}"
+
+
+def _adaptive_sigmoid_kernel(deviations: np.ndarray, std_devs: np.ndarray, sensitivities: np.ndarray,
+                             output_mins: np.ndarray, output_maxs: np.ndarray) -> np.ndarray:
+    """Numeric core of adaptive distribution normalization, one metric per row
+    
+    Maps each value's z-score (deviation from the row mean over the row's
+    std_dev), scaled by the row's sensitivity, through tanh into the row's
+    [output_min, output_max], clamped to [0, 1]. The mapping is monotonic
+    (non-decreasing) within a row. Z-scores are taken as 0 for rows with
+    std_dev <= 1e-6.
+    
+    Args:
+        deviations: (k, n) deviations from the row means
+        std_devs, sensitivities, output_mins, output_maxs: (k,) per-row parameters
+    """
+    # 标准化z-score并应用敏感度调整
+    adjusted_z = deviations / std_devs[:, None] * sensitivities[:, None]
+    adjusted_z[std_devs <= 1e-6] = 0.0
+    
+    # 改进的Sigmoid函数：避免极值但保持单调性
+    # 使用tanh函数，它比标准sigmoid在极值处更平缓
+    # 在z-score数组上原地计算（连续float64，一次调用完成整个矩阵的tanh）
+    sigmoid_vals = adjusted_z
+    sigmoid_vals *= 0.5
+    np.tanh(sigmoid_vals, out=sigmoid_vals)
+    sigmoid_vals *= 0.5
+    sigmoid_vals += 0.5
+    
+    # 映射到自适应输出范围，并确保在合理范围内
+    output_mins = output_mins[:, None]
+    sigmoid_vals *= output_maxs[:, None] - output_mins
+    sigmoid_vals += output_mins
+    return np.clip(sigmoid_vals, 0.0, 1.0, out=sigmoid_vals)
+
+
+def _preserves_order(values: np.ndarray, normalized: np.ndarray) -> bool:
+    """Check that stable-sorting by normalized gives the same order as stable-sorting by values
+    
+    Only the input is sorted. Walking it in that order, the (normalized, index)
+    pairs must be strictly increasing: the mapping may not reorder values, nor
+    collapse distinct values into a tie whose index order differs from the
+    input order (tanh saturation can do the latter).
+    """
+    order = np.argsort(values, kind="stable")
+    mapped = normalized[order]
+    current, following = mapped[:-1], mapped[1:]
+    return not (np.any(current > following)
+                or np.any((current == following) & (order[:-1] > order[1:])))
+
+
+def _three_sigma_sigmoid(array: np.ndarray, output_min: float) -> np.ndarray:
+    """Standard-deviation fallback of the precise normalizers
+    
+    Maps each value's 3-sigma z-score, doubled for sensitivity, through a
+    logistic sigmoid into [output_min, output_min + 0.8]. The centered values
+    are shared by the variance and the z-scores, and every step after that
+    runs in place on one buffer.
+    """
+    normalized = array - array.mean()
+    variance = float(np.dot(normalized, normalized)) / len(normalized)
+    std_dev = math.sqrt(variance) if variance > 0 else 1.0
+    
+    # 将z-score转换为概率：-z * 2 = (mean - val) * 2 / (3 * std)，系数只计算一次
+    normalized *= -2 / (std_dev * 3)
+    np.exp(normalized, out=normalized)
+    normalized += 1
+    np.reciprocal(normalized, out=normalized)
+    normalized *= 0.8
+    normalized += output_min
+    return normalized
+
+
+def _adaptive_weights(weights: Tuple[float, ...], cvs: Tuple[float, ...]) -> Tuple[float, ...]:
+    """Shift weight towards the metrics with higher variation (more discriminative)
+    
+    Each weight is scaled by (1 + cv / total_cv), then all are rescaled so they
+    keep the original sum. Weights are returned unchanged when total_cv is not positive.
+    Plain floats are used: with two or three weights NumPy call overhead would
+    exceed the arithmetic.
+    """
+    total_cv = sum(cvs)
+    if not total_cv > 0:
+        return weights
+    
+    adaptive = [weight * (1 + cv / total_cv) for weight, cv in zip(weights, cvs)]
+    total_adaptive = sum(adaptive)
+    original_sum = sum(weights)
+    if total_adaptive > 0:
+        adaptive = [weight * original_sum / total_adaptive for weight in adaptive]
+    return tuple(adaptive)
+
+
+@lru_cache(maxsize=128)
+def _waiting_intensity(max_waiting: float, steepness: float, transition_point: float) -> float:
+    """Dynamic waiting weight adjustment factor tanh(max_waiting * steepness / transition_point)
+    
+    Queue lengths are integral and repeat across scoring ticks, so the few
+    distinct (max_waiting, steepness, transition_point) combinations are cached.
+    """
+    return math.tanh(max_waiting * steepness / transition_point)
+
+
+def _score_percentages(scores: Sequence[float]) -> np.ndarray:
+    """Each score's share of the summed scores, in percent
+    
+    The total is reduced and the shares divided in NumPy, once for the pool
+    rather than once per logged member. All shares are 0.0 when the total is
+    not positive.
+    """
+    array = np.asarray(scores, dtype=np.float64)
+    total = float(array.sum())
+    if total > 0:
+        array = array / total
+        array *= 100
+        return array
+    return np.zeros_like(array)
+
+
 class ScoreCalculator:
     """Score calculator"""
     
+    __slots__ = ("logger", "_buffers", "_metrics_cache", "_normalize_cache", "_normalize_cache_lock")
+    
+    # Algorithm mode -> (scoring method name, ALGORITHM_CHECK log message or None)
+    _ALGORITHMS: Dict[str, Tuple[str, Optional[str]]] = {
+        "s1": ("_calculate_s1_scores", "Executing S1 algorithm"),
+        "s1_enhanced": ("_calculate_s1_enhanced_scores", "Executing S1_ENHANCED algorithm"),
+        "s1_adaptive": ("_calculate_s1_adaptive_scores", "Executing S1_ADAPTIVE algorithm"),
+        "s1_ratio": ("_calculate_s1_ratio_scores", "Executing S1_RATIO algorithm"),
+        "s1_precise": ("_calculate_s1_precise_scores", "Executing S1_PRECISE algorithm"),
+        "s1_nonlinear": ("_calculate_s1_nonlinear_scores", "Executing S1_NONLINEAR algorithm"),
+        "s1_balanced": ("_calculate_s1_balanced_scores", "Executing S1_BALANCED algorithm"),
+        "s2": ("_calculate_s2_scores", None),
+        "s2_enhanced": ("_calculate_s2_enhanced_scores", None),
+        "s2_nonlinear": ("_calculate_s2_nonlinear_scores", None),
+        "s2_adaptive": ("_calculate_s2_adaptive_scores", None),
+        "s1_adaptive_distribution": ("_calculate_s1_adaptive_distribution_scores",
+                                     "Executing S1_ADAPTIVE_DISTRIBUTION algorithm"),
+        "s1_advanced": ("_calculate_s1_advanced_scores",
+                        "Executing S1_ADVANCED algorithm (自适应分布归一化+动态权重)"),
+        "s2_advanced": ("_calculate_s2_advanced_scores",
+                        "Executing S2_ADVANCED algorithm (自适应分布归一化+动态权重)"),
+        "s1_dynamic_waiting": ("_calculate_s1_dynamic_waiting_scores",
+                               "Executing S1_DYNAMIC_WAITING algorithm (动态waiting权重调整)"),
+        "s2_dynamic_waiting": ("_calculate_s2_dynamic_waiting_scores",
+                               "Executing S2_DYNAMIC_WAITING algorithm (动态waiting权重调整-三指标版本)"),
+    }
+    
+    # Adaptive distribution parameters by CV band (cv < 0.1, < 0.3, < 0.8, otherwise):
+    # (sensitivity, output_range)
+    _CV_THRESHOLDS = (0.1, 0.3, 0.8)
+    _CV_PARAMETERS = (
+        (3.0, (0.4, 0.6)),    # 低变异：数据相近，使用高敏感度，窄范围
+        (2.0, (0.25, 0.75)),  # 中等变异：平衡敏感度和稳定性
+        (1.5, (0.15, 0.85)),  # 高变异：使用中等敏感度
+        (1.0, (0.1, 0.9)),    # 极高变异：降低敏感度避免过度反应
+    )
+    
+    # Dynamic waiting weight factors per metric: (factor at waiting_intensity 0,
+    # max factor - min factor), the change towards waiting_intensity 1
+    _S1_DYNAMIC_WAITING_FACTORS = (
+        (0.2, 2.5 - 0.2),  # waiting
+        (1.8, 0.3 - 1.8),  # cache
+    )
+    _S2_DYNAMIC_WAITING_FACTORS = (
+        (0.1, 2.5 - 0.1),  # waiting
+        (1.5, 0.4 - 1.5),  # cache
+        (1.4, 0.6 - 1.4),  # running
+    )
+    
+    # Number of distinct adaptive distribution inputs remembered across scoring ticks
+    _NORMALIZE_CACHE_SIZE = 256
+    
+    # Smooth normalization output range by relative difference band
+    # (< 0.1, < 0.3, < 0.8, < 2.0, otherwise)
+    _SMOOTH_THRESHOLDS = (0.1, 0.3, 0.8, 2.0)
+    _SMOOTH_RANGES = (
+        (0.45, 0.55),  # 差异很小：几乎均衡分配
+        (0.35, 0.65),  # 差异较小：轻微倾斜
+        (0.25, 0.75),  # 差异中等：中等倾斜
+        (0.15, 0.85),  # 差异较大：明显倾斜
+        (0.05, 0.95),  # 差异很大：强烈倾斜但仍避免完全极值
+    )
+    
     def __init__(self):
         self.logger = get_logger()
+        # Reusable score buffers per pool, grown on demand: {(pool, partition, name): ndarray}
+        self._buffers: Dict[Tuple[str, str, str], np.ndarray] = {}
+        # Last collected metrics per pool and key set:
+        # {(pool, partition, keys): (member stamps, valid_members, skipped (member, reason) pairs, arrays)}
+        self._metrics_cache: Dict[Tuple[str, str, Tuple[str, ...]], tuple] = {}
+        # LRU of adaptive distribution results keyed on the exact input:
+        # {(metric types, debug enabled, shape, raw bytes): (results, log records)}
+        self._normalize_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # Pools may be scored from worker threads; OrderedDict reordering is not thread-safe
+        self._normalize_cache_lock = threading.Lock()
     
     def calculate_pool_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """Calculate scores for all members in the pool"""
+        log = self.logger
         if not pool.members:
-            self.logger.debug(f"Pool {pool.name} has no members, skipping score calculation")
+            log.debug(f"Pool {pool.name} has no members, skipping score calculation")
             return
         
-        self.logger.info(f"Starting score calculation for Pool {pool.name} with {len(pool.members)} members")
+        log.info(f"Starting score calculation for Pool {pool.name} with {len(pool.members)} members")
         
         try:
             # Special handling for XInference engine type
             if pool.engine_type == EngineType.XINFERENCE:
-                self.logger.info("ALGORITHM_CHECK: XInference engine detected, using throughput_utilization directly")
+                log.info("ALGORITHM_CHECK: XInference engine detected, using throughput_utilization directly")
                 self._calculate_xinference_scores(pool)
                 return
             
             # Regular algorithm processing for vLLM/SGLang
-            self.logger.info(f"ALGORITHM_CHECK: Using algorithm mode: {mode_config.name}")
-            if mode_config.name == "s1":
-                self.logger.info("ALGORITHM_CHECK: Executing S1 algorithm")
-                self._calculate_s1_scores(pool, mode_config)
-            elif mode_config.name == "s1_enhanced":
-                self.logger.info("ALGORITHM_CHECK: Executing S1_ENHANCED algorithm")
-                self._calculate_s1_enhanced_scores(pool, mode_config)
-            elif mode_config.name == "s1_adaptive":
-                self.logger.info("ALGORITHM_CHECK: Executing S1_ADAPTIVE algorithm")
-                self._calculate_s1_adaptive_scores(pool, mode_config)
-            elif mode_config.name == "s1_ratio":
-                self.logger.info("ALGORITHM_CHECK: Executing S1_RATIO algorithm")
-                self._calculate_s1_ratio_scores(pool, mode_config)
-            elif mode_config.name == "s1_precise":
-                self.logger.info("ALGORITHM_CHECK: Executing S1_PRECISE algorithm")
-                self._calculate_s1_precise_scores(pool, mode_config)
-            elif mode_config.name == "s1_nonlinear":
-                self.logger.info("ALGORITHM_CHECK: Executing S1_NONLINEAR algorithm")
-                self._calculate_s1_nonlinear_scores(pool, mode_config)
-            elif mode_config.name == "s1_balanced":
-                self.logger.info("ALGORITHM_CHECK: Executing S1_BALANCED algorithm")
-                self._calculate_s1_balanced_scores(pool, mode_config)
-            elif mode_config.name == "s2":
-                self._calculate_s2_scores(pool, mode_config)
-            elif mode_config.name == "s2_enhanced":
-                self._calculate_s2_enhanced_scores(pool, mode_config)
-            elif mode_config.name == "s2_nonlinear":
-                self._calculate_s2_nonlinear_scores(pool, mode_config)
-            elif mode_config.name == "s2_adaptive":
-                self._calculate_s2_adaptive_scores(pool, mode_config)
-            elif mode_config.name == "s1_adaptive_distribution":
-                self.logger.info("ALGORITHM_CHECK: Executing S1_ADAPTIVE_DISTRIBUTION algorithm")
-                self._calculate_s1_adaptive_distribution_scores(pool, mode_config)
-            elif mode_config.name == "s1_advanced":
-                self.logger.info("ALGORITHM_CHECK: Executing S1_ADVANCED algorithm (自适应分布归一化+动态权重)")
-                self._calculate_s1_advanced_scores(pool, mode_config)
-            elif mode_config.name == "s2_advanced":
-                self.logger.info("ALGORITHM_CHECK: Executing S2_ADVANCED algorithm (自适应分布归一化+动态权重)")
-                self._calculate_s2_advanced_scores(pool, mode_config)
-            elif mode_config.name == "s1_dynamic_waiting":
-                self.logger.info("ALGORITHM_CHECK: Executing S1_DYNAMIC_WAITING algorithm (动态waiting权重调整)")
-                self._calculate_s1_dynamic_waiting_scores(pool, mode_config)
-            elif mode_config.name == "s2_dynamic_waiting":
-                self.logger.info("ALGORITHM_CHECK: Executing S2_DYNAMIC_WAITING algorithm (动态waiting权重调整-三指标版本)")
-                self._calculate_s2_dynamic_waiting_scores(pool, mode_config)
-            else:
-                self.logger.error(f"Unsupported algorithm mode: {mode_config.name}")
-                raise ScoreCalculationError(f"Unsupported algorithm mode: {mode_config.name}")
+            mode_name = mode_config.name
+            log.info(f"ALGORITHM_CHECK: Using algorithm mode: {mode_name}")
+            algorithm = self._ALGORITHMS.get(mode_name)
+            if algorithm is None:
+                log.error(f"Unsupported algorithm mode: {mode_name}")
+                raise ScoreCalculationError(f"Unsupported algorithm mode: {mode_name}")
+            
+            method_name, check_message = algorithm
+            if check_message:
+                log.info(f"ALGORITHM_CHECK: {check_message}")
+            getattr(self, method_name)(pool, mode_config)
             
-            self.logger.info(f"Completed score calculation for Pool {pool.name}")
+            log.info(f"Completed score calculation for Pool {pool.name}")
             
         except Exception as e:
-            self.logger.error(f"Failed to calculate scores for Pool {pool.name}: {e}")
+            log.error(f"Failed to calculate scores for Pool {pool.name}: {e}")
             raise ScoreCalculationError(f"Failed to calculate scores for Pool {pool.name}: {e}")
     
     def _calculate_xinference_scores(self, pool: Pool) -> None:
@@ -102,57 +418,165 @@ class ScoreCalculator:
         """
         total_members = len(pool.members)
         total_models_processed = 0
+        log = self.logger
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
         
         for member in pool.members:
-            # Clear previous model scores
-            member.model_scores = {}
-            
-            if member.model_metrics:
-                # Precompute scores for all models
-                for model_name, utilization in member.model_metrics.items():
-                    # Convert utilization to score: higher utilization = lower score
-                    score = max(0.001, 1.0 - utilization)
-                    member.model_scores[model_name] = score
-                    total_models_processed += 1
-                
-                self.logger.debug(f"XInference member {member}: precomputed scores for {len(member.model_scores)} models: {[(k, f'{v:.3f}') for k, v in member.model_scores.items()]}")
+            model_metrics = member.model_metrics
+            if model_metrics:
+                # Precompute scores for all models (replacing previous model scores)
+                # Convert utilization to score: higher utilization = lower score
+                model_scores = {
+                    model_name: max(0.001, 1.0 - utilization)
+                    for model_name, utilization in model_metrics.items()
+                }
+                member.model_scores = model_scores
+                total_models_processed += len(model_scores)
+                
+                if debug_enabled:
+                    log.debug(f"XInference member {member}: precomputed scores for {len(model_scores)} models: {[(k, f'{v:.3f}') for k, v in model_scores.items()]}")
             else:
-                self.logger.warning(f"XInference member {member} has no model metrics")
+                # Clear previous model scores
+                member.model_scores = {}
+                log.warning(f"XInference member {member} has no model metrics")
             
             # Set default score for member
             member.score = 0.001
         
-        self.logger.info(f"XInference score calculation completed for Pool {pool.name}: {total_members} members, {total_models_processed} model scores precomputed")
+        log.info(f"XInference score calculation completed for Pool {pool.name}: {total_members} members, {total_models_processed} model scores precomputed")
 
 
-    def _calculate_s1_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
-        """Calculate scores using S1 algorithm"""
-        # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
+    def _collect_metrics(self, pool: Pool, keys: Tuple[str, ...]) -> Tuple[List[PoolMember], Tuple[np.ndarray, ...]]:
+        """Collect the given metrics of all pool members into arrays
+        
+        Members without metrics, or missing any of the requested keys, are skipped
+        (with a warning) and keep their original score.
+        
+        The result is cached per pool and key set, and reused while no member
+        has been replaced and no member's metrics have changed since (tracked
+        by each member's metrics_stamp, which an identical re-collection keeps).
+        The cached arrays are read-only. Entries of removed Pools are released
+        by prune_pools.
+        
+        Args:
+            pool: Pool whose members are collected
+            keys: Two or more metric names to collect, in output order
+            
+        Returns:
+            (valid_members, arrays) where arrays[k][i] is metric keys[k] of valid_members[i]
+        """
+        cache_key = (pool.name, pool.partition, keys)
+        stamps = [member.metrics_stamp for member in pool.members]
+        cached = self._metrics_cache.get(cache_key)
+        if cached is not None and cached[0] == stamps:
+            _, valid_members, skipped, arrays = cached
+            for member, reason in skipped:
+                self.logger.warning(f"Member {member} {reason}, keeping original score: {member.score:.3f}")
+            return valid_members, arrays
+        
+        # Pull the requested fields out of each typed record in one C-level call
+        get_row = itemgetter(*(MetricsRecord._fields.index(key) for key in keys))
         valid_members = []
+        rows = []
+        skipped = []
         
         for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            
-            if waiting_queue is None or cache_usage is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            valid_members.append(member)
+            record = member.metrics_record
+            if record is None:
+                reason = "has no metrics data"
+            else:
+                row = get_row(record)
+                if None not in row:
+                    rows.append(row)
+                    valid_members.append(member)
+                    continue
+                reason = "missing key metrics"
+            
+            self.logger.warning(f"Member {member} {reason}, keeping original score: {member.score:.3f}")
+            skipped.append((member, reason))
+        
+        # Convert all collected rows at once; each metric becomes a contiguous row of the transpose
+        matrix = np.array(rows, dtype=np.float64).reshape(len(rows), len(keys))
+        arrays = tuple(np.ascontiguousarray(matrix.T))
+        for array in arrays:
+            array.flags.writeable = False
+        self._metrics_cache[cache_key] = (stamps, valid_members, skipped, arrays)
+        return valid_members, arrays
+    
+    def _buffer(self, pool: Pool, name: str, n: int) -> np.ndarray:
+        """Get a reusable float64 buffer of length n for this pool
+        
+        Pool sizes are stable between polling cycles, so after the first pass
+        scoring reuses the same arrays instead of allocating new ones. A size
+        change reallocates, so a pool that shrinks does not keep its peak size.
+        """
+        key = (pool.name, pool.partition, name)
+        buffer = self._buffers.get(key)
+        if buffer is None or buffer.shape[0] != n:
+            buffer = np.empty(n, dtype=np.float64)
+            self._buffers[key] = buffer
+        return buffer
+    
+    def prune_pools(self, live_pool_keys) -> None:
+        """Release per-pool state of Pools that no longer exist
+        
+        Args:
+            live_pool_keys: (name, partition) keys of the remaining Pools, e.g. POOLS.keys()
+        """
+        # Iterate over snapshots: other threads may be scoring and adding entries
+        for cache in (self._buffers, self._metrics_cache):
+            for key in list(cache):
+                if key[:2] not in live_pool_keys:
+                    cache.pop(key, None)
+    
+    def _score_buffers(self, pool: Pool, n: int) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Get (out, work) buffers for the score kernels; tiny pools need none
+        
+        work holds the stacked metric matrix, up to three metrics per member.
+        """
+        if n <= 2:
+            return None, None
+        return self._buffer(pool, "scores", n), self._buffer(pool, "work", 3 * n)
+    
+    def _assign_scores(self, members: List[PoolMember], score_values: np.ndarray) -> Tuple[Optional[List[float]], List[float]]:
+        """Write computed scores back to members
+        
+        Non-finite results (NaN/inf from bad metric values) are replaced by the
+        member's original score, checked once over the whole array.
+        
+        Returns:
+            (old_scores, new_scores) aligned with members; old_scores is only
+            collected for debug logging and is None when DEBUG is disabled
+        """
+        old_scores = [member.score for member in members] if self.logger.isEnabledFor(logging.DEBUG) else None
+        
+        new_scores = score_values.tolist()
+        bad = np.flatnonzero(~np.isfinite(score_values)).tolist()
+        
+        for i in bad:
+            original_score = members[i].score
+            self.logger.warning(f"Non-finite score calculated for member {members[i]}, keeping original score: {original_score:.3f}")
+            new_scores[i] = original_score
+        
+        # Atomic score update (assignment operations are atomic in Python)
+        for member, new_score in zip(members, new_scores):
+            member.score = new_score
+        
+        return old_scores, new_scores
+    
+    def _calculate_s1_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
+        """Calculate scores using S1 algorithm"""
+        # Collect metrics from all members
+        valid_members, (waiting_queue_values, cache_usage_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
+        w_a, w_b = mode_config.w_a, mode_config.w_b
+        
         # Min-max normalize waiting queue values
         normalized_waiting = self._min_max_normalize(waiting_queue_values)
         
@@ -160,472 +584,274 @@ class ScoreCalculator:
         normalized_cache = cache_usage_values
         
         # Calculate score for each member
-        new_scores = []  # Store all new score values for sum calculation
-        old_scores = []  # Store all old score values for logging
+        # S1 algorithm: score = w_a * (1 - normalized_waiting) + w_b * (1 - cache_usage)
+        # This way, smaller waiting_queue and cache_usage result in higher scores
+        # Cache usage in the engine typically represents kv cache utilization. Theoretically, a moderate range is better, as both too high and too low are suboptimal. However, from an external Gateway product perspective, lower utilization indicates more available capacity on that machine.
+        out, work = self._score_buffers(pool, len(valid_members))
+        score_values = _s1_score_kernel(normalized_waiting, normalized_cache, w_a, w_b, out=out, work=work)
         
-        for i, member in enumerate(valid_members):
-            try:
-                # S1 algorithm: score = w_a * (1 - normalized_waiting) + w_b * (1 - cache_usage)
-                # This way, smaller waiting_queue and cache_usage result in higher scores
-                # Cache usage in the engine typically represents kv cache utilization. Theoretically, a moderate range is better, as both too high and too low are suboptimal. However, from an external Gateway product perspective, lower utilization indicates more available capacity on that machine.
-                new_score = (
-                    mode_config.w_a * (1.0 - normalized_waiting[i]) +
-                    mode_config.w_b * (1.0 - normalized_cache[i])
-                )
-                
-                # Ensure score is within reasonable range
-                new_score = max(0.0, min(1.0, new_score))
-                
-                # Atomic score update (assignment operations are atomic in Python)
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)  # Use original score
-                old_scores.append(member.score)  # Old score is also current score
-        
-        # Calculate total sum of all scores
-        total_score = sum(new_scores)
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        # Re-iterate through valid members to output logs with percentages
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            # Re-iterate through valid members to output logs with percentages
+            log = self.logger
             try:
-                # Calculate this member's score percentage of total
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]:.3f}(normalized：{normalized_waiting[i]:.3f}), "
-                    f"cache={cache_usage_values[i]:.3f}, score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, norm_waiting, cache, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, normalized_waiting, cache_usage_values, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting:.3f}(normalized：{norm_waiting:.3f}), "
+                        f"cache={cache:.3f}, score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}")
+                log.warning(f"Exception logging member {member}: {e}")
     
     def _calculate_s1_enhanced_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """Calculate scores using S1 Enhanced algorithm (with normalized cache_usage)"""
         # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
-        valid_members = []
-        
-        for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            
-            if waiting_queue is None or cache_usage is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            valid_members.append(member)
+        valid_members, (waiting_queue_values, cache_usage_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
+        w_a, w_b = mode_config.w_a, mode_config.w_b
+        
         # Use precise normalization for better differentiation
         normalized_waiting = self._min_max_normalize(waiting_queue_values)
         normalized_cache = self._precise_cache_normalize(cache_usage_values)  # Use precise cache normalization
         
         # Calculate score for each member
-        new_scores = []  # Store all new score values for sum calculation
-        old_scores = []  # Store all old score values for logging
+        # S1 Enhanced algorithm: score = w_a * (1 - normalized_waiting) + w_b * (1 - normalized_cache)
+        # Both metrics are normalized to amplify differences
+        out, work = self._score_buffers(pool, len(valid_members))
+        score_values = _s1_score_kernel(normalized_waiting, normalized_cache, w_a, w_b, out=out, work=work)
         
-        for i, member in enumerate(valid_members):
-            try:
-                # S1 Enhanced algorithm: score = w_a * (1 - normalized_waiting) + w_b * (1 - normalized_cache)
-                # Both metrics are normalized to amplify differences
-                new_score = (
-                    mode_config.w_a * (1.0 - normalized_waiting[i]) +
-                    mode_config.w_b * (1.0 - normalized_cache[i])
-                )
-                
-                # Ensure score is within reasonable range
-                new_score = max(0.0, min(1.0, new_score))
-                
-                # Atomic score update (assignment operations are atomic in Python)
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)  # Use original score
-                old_scores.append(member.score)  # Old score is also current score
-        
-        # Calculate total sum of all scores
-        total_score = sum(new_scores)
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        # Re-iterate through valid members to output logs with percentages
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            # Re-iterate through valid members to output logs with percentages
+            log = self.logger
             try:
-                # Calculate this member's score percentage of total
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]:.3f}(norm：{normalized_waiting[i]:.3f}), "
-                    f"cache={cache_usage_values[i]:.3f}(norm：{normalized_cache[i]:.3f}), "
-                    f"score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, norm_waiting, cache, norm_cache, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, normalized_waiting, cache_usage_values, normalized_cache, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting:.3f}(norm：{norm_waiting:.3f}), "
+                        f"cache={cache:.3f}(norm：{norm_cache:.3f}), "
+                        f"score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}")
+                log.warning(f"Exception logging member {member}: {e}")
     
     def _calculate_s1_adaptive_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """Calculate scores using S1 Adaptive algorithm (dynamic weight adjustment)"""
         # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
-        valid_members = []
-        
-        for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            
-            if waiting_queue is None or cache_usage is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            valid_members.append(member)
+        valid_members, (waiting_queue_values, cache_usage_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
+        w_a, w_b = mode_config.w_a, mode_config.w_b
+        
         # Calculate coefficient of variation (CV) for each metric to determine importance
-        def coefficient_of_variation(values):
-            if len(values) <= 1:
-                return 0.0
-            mean = sum(values) / len(values)
-            if mean == 0:
-                return 0.0
-            variance = sum((x - mean) ** 2 for x in values) / len(values)
-            std_dev = math.sqrt(variance)
-            return std_dev / mean
-        
-        cv_waiting = coefficient_of_variation(waiting_queue_values)
-        cv_cache = coefficient_of_variation(cache_usage_values)
+        cv_waiting = _coefficient_of_variation(waiting_queue_values)
+        cv_cache = _coefficient_of_variation(cache_usage_values)
         
         # Dynamically adjust weights based on variation
-        total_cv = cv_waiting + cv_cache
-        if total_cv > 0:
-            # Give more weight to metrics with higher variation (more discriminative)
-            adaptive_w_a = mode_config.w_a * (1 + cv_waiting / total_cv)
-            adaptive_w_b = mode_config.w_b * (1 + cv_cache / total_cv)
-            
-            # Normalize to ensure sum equals original sum
-            total_adaptive = adaptive_w_a + adaptive_w_b
-            original_sum = mode_config.w_a + mode_config.w_b
-            if total_adaptive > 0:
-                adaptive_w_a = adaptive_w_a * original_sum / total_adaptive
-                adaptive_w_b = adaptive_w_b * original_sum / total_adaptive
-        else:
-            adaptive_w_a = mode_config.w_a
-            adaptive_w_b = mode_config.w_b
+        adaptive_w_a, adaptive_w_b = _adaptive_weights((w_a, w_b), (cv_waiting, cv_cache))
         
-        self.logger.debug(f"Adaptive weights: w_a={adaptive_w_a:.3f}, w_b={adaptive_w_b:.3f} "
-                         f"(CV: waiting={cv_waiting:.3f}, cache={cv_cache:.3f})")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Adaptive weights: w_a={adaptive_w_a:.3f}, w_b={adaptive_w_b:.3f} "
+                             f"(CV: waiting={cv_waiting:.3f}, cache={cv_cache:.3f})")
         
         # Normalize all metrics
         normalized_waiting = self._min_max_normalize(waiting_queue_values)
         normalized_cache = self._min_max_normalize(cache_usage_values)
         
         # Calculate score for each member with adaptive weights
-        new_scores = []
-        old_scores = []
+        out, work = self._score_buffers(pool, len(valid_members))
+        score_values = _s1_score_kernel(normalized_waiting, normalized_cache, adaptive_w_a, adaptive_w_b, out=out, work=work)
         
-        for i, member in enumerate(valid_members):
-            try:
-                new_score = (
-                    adaptive_w_a * (1.0 - normalized_waiting[i]) +
-                    adaptive_w_b * (1.0 - normalized_cache[i])
-                )
-                
-                new_score = max(0.0, min(1.0, new_score))
-                
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)
-                old_scores.append(member.score)
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        # Calculate total sum and log results
-        total_score = sum(new_scores)
-        
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            log = self.logger
             try:
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]:.3f}(norm：{normalized_waiting[i]:.3f}), "
-                    f"cache={cache_usage_values[i]:.3f}(norm：{normalized_cache[i]:.3f}), "
-                    f"score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, norm_waiting, cache, norm_cache, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, normalized_waiting, cache_usage_values, normalized_cache, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting:.3f}(norm：{norm_waiting:.3f}), "
+                        f"cache={cache:.3f}(norm：{norm_cache:.3f}), "
+                        f"score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}")
+                log.warning(f"Exception logging member {member}: {e}")
     
     def _calculate_s1_ratio_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """Calculate scores using S1 Ratio algorithm"""
         # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
-        valid_members = []
-        
-        for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            
-            if waiting_queue is None or cache_usage is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            valid_members.append(member)
+        valid_members, (waiting_queue_values, cache_usage_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
+        w_a, w_b = mode_config.w_a, mode_config.w_b
+        
         # Use ratio-based normalization for cache usage values
         normalized_cache = self._ratio_based_normalize(cache_usage_values)
         
         # Calculate score for each member
-        new_scores = []
-        old_scores = []
+        # S1 Ratio algorithm: score = w_a * (1 - waiting_queue) + w_b * (1 - normalized_cache)
+        # Lower cache usage (better performance) gets higher score
+        out, work = self._score_buffers(pool, len(valid_members))
+        score_values = _s1_score_kernel(waiting_queue_values, normalized_cache, w_a, w_b, clip=False, out=out, work=work)
         
-        for i, member in enumerate(valid_members):
-            try:
-                # S1 Ratio algorithm: score = w_a * (1 - waiting_queue) + w_b * (1 - normalized_cache)
-                # Lower cache usage (better performance) gets higher score
-                new_score = (
-                    mode_config.w_a * (1.0 - waiting_queue_values[i]) +
-                    mode_config.w_b * (1.0 - normalized_cache[i])
-                )
-                
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)
-                old_scores.append(member.score)
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        # Calculate total sum and log results
-        total_score = sum(new_scores)
-        
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            log = self.logger
             try:
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]:.3f}, cache={cache_usage_values[i]:.3f}(norm:{normalized_cache[i]:.3f}), "
-                    f"score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, cache, norm_cache, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, cache_usage_values, normalized_cache, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting:.3f}, cache={cache:.3f}(norm:{norm_cache:.3f}), "
+                        f"score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}")
+                log.warning(f"Exception logging member {member}: {e}")
     
     def _calculate_s1_precise_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """Calculate scores using S1 Precise algorithm"""
         # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
-        valid_members = []
-        
-        for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            
-            if waiting_queue is None or cache_usage is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            valid_members.append(member)
+        valid_members, (waiting_queue_values, cache_usage_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
-        # Calculate score for each member
-        new_scores = []
-        old_scores = []
+        w_a, w_b = mode_config.w_a, mode_config.w_b
         
-        for i, member in enumerate(valid_members):
-            try:
-                # S1 Precise algorithm: score = w_a * (1 - waiting_queue) + w_b * (1 - cache_usage)
-                # This way, smaller waiting_queue and cache_usage result in higher scores
-                new_score = (
-                    mode_config.w_a * (1.0 - waiting_queue_values[i]) +
-                    mode_config.w_b * (1.0 - cache_usage_values[i])
-                )
-                
-                # Ensure score is within reasonable range
-                new_score = max(0.0, min(1.0, new_score))
-                
-                # Atomic score update (assignment operations are atomic in Python)
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)
-                old_scores.append(member.score)
+        # Calculate score for each member
+        # S1 Precise algorithm: score = w_a * (1 - waiting_queue) + w_b * (1 - cache_usage)
+        # This way, smaller waiting_queue and cache_usage result in higher scores
+        out, work = self._score_buffers(pool, len(valid_members))
+        score_values = _s1_score_kernel(waiting_queue_values, cache_usage_values, w_a, w_b, out=out, work=work)
         
-        # Calculate total sum of all scores
-        total_score = sum(new_scores)
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        # Re-iterate through valid members to output logs with percentages
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            # Re-iterate through valid members to output logs with percentages
+            log = self.logger
             try:
-                # Calculate this member's score percentage of total
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]:.3f}, cache={cache_usage_values[i]:.3f}, "
-                    f"score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, cache, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, cache_usage_values, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting:.3f}, cache={cache:.3f}, "
+                        f"score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}")
+                log.warning(f"Exception logging member {member}: {e}")
     
     def _calculate_s1_nonlinear_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """Calculate scores using S1 Nonlinear algorithm (ChatGPT suggestion with power amplification)"""
         # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
-        valid_members = []
-        
-        for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            
-            if waiting_queue is None or cache_usage is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            valid_members.append(member)
+        valid_members, (waiting_queue_values, cache_usage_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
+        w_a, w_b = mode_config.w_a, mode_config.w_b
+        
         # ChatGPT suggested method: Min-Max normalization with epsilon + non-linear amplification
         epsilon = 1e-6  # Prevent division by zero
         power = getattr(mode_config, 'power', 2.0)  # Configurable power, default 2.0
         
+        waiting = np.asarray(waiting_queue_values, dtype=np.float64)
+        cache = np.asarray(cache_usage_values, dtype=np.float64)
+        
         # Min-Max normalize with epsilon protection
-        min_w, max_w = min(waiting_queue_values), max(waiting_queue_values)
-        min_c, max_c = min(cache_usage_values), max(cache_usage_values)
+        min_w, max_w = waiting.min(), waiting.max()
+        min_c, max_c = cache.min(), cache.max()
         
         if max_w == min_w:
-            normalized_waiting = [0.0] * len(waiting_queue_values)
+            normalized_waiting = np.zeros_like(waiting)
         else:
-            normalized_waiting = [(w - min_w) / (max_w - min_w + epsilon) for w in waiting_queue_values]
+            normalized_waiting = (waiting - min_w) / (max_w - min_w + epsilon)
         
         if max_c == min_c:
-            normalized_cache = [0.5] * len(cache_usage_values)
+            normalized_cache = np.full_like(cache, 0.5)
         else:
-            normalized_cache = [(c - min_c) / (max_c - min_c + epsilon) for c in cache_usage_values]
-        
-        # Non-linear amplification for cache usage (ChatGPT suggestion)
-        amplified_cache = [nc ** power for nc in normalized_cache]
+            normalized_cache = (cache - min_c) / (max_c - min_c + epsilon)
+        
+        # Non-linear amplification for cache usage (ChatGPT suggestion),
+        # then re-normalize amplified values to [0,1] range in place
+        # Integer powers are specialized to plain multiplies instead of pow()
+        if power == 2.0:
+            amplified_cache = normalized_cache * normalized_cache
+        elif power == 3.0:
+            amplified_cache = normalized_cache * normalized_cache
+            amplified_cache *= normalized_cache
+        else:
+            amplified_cache = np.power(normalized_cache, power)
+        min_amp, max_amp = amplified_cache.min(), amplified_cache.max()
+        if max_amp > min_amp:
+            amplified_cache -= min_amp
+            amplified_cache /= (max_amp - min_amp)
         
-        # Re-normalize amplified values to [0,1] range
-        if max(amplified_cache) > min(amplified_cache):
-            min_amp, max_amp = min(amplified_cache), max(amplified_cache)
-            amplified_cache = [(ac - min_amp) / (max_amp - min_amp) for ac in amplified_cache]
+        # Score calculation: w_a * (1 - waiting_norm) + w_b * (1 - cache_amplified)
+        out, work = self._score_buffers(pool, len(valid_members))
+        score_values = _s1_score_kernel(normalized_waiting, amplified_cache, w_a, w_b, out=out, work=work)
         
-        # Calculate score for each member
-        new_scores = []
-        old_scores = []
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        for i, member in enumerate(valid_members):
-            try:
-                # Score calculation: w_a * (1 - waiting_norm) + w_b * (1 - cache_amplified)
-                new_score = (
-                    mode_config.w_a * (1.0 - normalized_waiting[i]) +
-                    mode_config.w_b * (1.0 - amplified_cache[i])
-                )
-                
-                new_score = max(0.0, min(1.0, new_score))
-                
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)
-                old_scores.append(member.score)
-        
-        # Calculate total sum and log results
-        total_score = sum(new_scores)
-        
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            log = self.logger
             try:
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]:.3f}(norm:{normalized_waiting[i]:.3f}), "
-                    f"cache={cache_usage_values[i]:.3f}(norm:{normalized_cache[i]:.3f}→amp:{amplified_cache[i]:.3f}), "
-                    f"power={power}, score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, norm_waiting, cache, norm_cache, amp_cache, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, normalized_waiting, cache_usage_values, normalized_cache, amplified_cache, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting:.3f}(norm:{norm_waiting:.3f}), "
+                        f"cache={cache:.3f}(norm:{norm_cache:.3f}→amp:{amp_cache:.3f}), "
+                        f"power={power}, score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}")
+                log.warning(f"Exception logging member {member}: {e}")
     
     def _calculate_s1_balanced_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """
@@ -637,117 +863,65 @@ class ScoreCalculator:
         3. 避免过度极化的流量分配
         """
         # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
-        valid_members = []
-        
-        for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            
-            if waiting_queue is None or cache_usage is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            valid_members.append(member)
+        valid_members, (waiting_queue_values, cache_usage_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
+        w_a, w_b = mode_config.w_a, mode_config.w_b
+        
         # 使用平滑归一化方法，避免极值
         normalized_waiting = self._smooth_normalize(waiting_queue_values)
         normalized_cache = self._smooth_normalize(cache_usage_values)
         
         # Log normalization details for debugging
-        self.logger.debug(f"Smooth normalization results:")
-        self.logger.debug(f"  Waiting: {waiting_queue_values} → {[f'{v:.3f}' for v in normalized_waiting]}")
-        self.logger.debug(f"  Cache: {cache_usage_values} → {[f'{v:.3f}' for v in normalized_cache]}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Smooth normalization results:")
+            self.logger.debug(f"  Waiting: {waiting_queue_values.tolist()} → {[f'{v:.3f}' for v in normalized_waiting]}")
+            self.logger.debug(f"  Cache: {cache_usage_values.tolist()} → {[f'{v:.3f}' for v in normalized_cache]}")
         
         # Calculate score for each member
-        new_scores = []
-        old_scores = []
+        # S1 Balanced algorithm: score = w_a * (1 - normalized_waiting) + w_b * (1 - normalized_cache)
+        # 使用平滑归一化后的值，避免极值影响
+        out, work = self._score_buffers(pool, len(valid_members))
+        score_values = _s1_score_kernel(normalized_waiting, normalized_cache, w_a, w_b, out=out, work=work)
         
-        for i, member in enumerate(valid_members):
-            try:
-                # S1 Balanced algorithm: score = w_a * (1 - normalized_waiting) + w_b * (1 - normalized_cache)
-                # 使用平滑归一化后的值，避免极值影响
-                new_score = (
-                    mode_config.w_a * (1.0 - normalized_waiting[i]) +
-                    mode_config.w_b * (1.0 - normalized_cache[i])
-                )
-                
-                # Ensure score is within reasonable range
-                new_score = max(0.0, min(1.0, new_score))
-                
-                # Atomic score update (assignment operations are atomic in Python)
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)
-                old_scores.append(member.score)
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        # Calculate total sum of all scores
-        total_score = sum(new_scores)
-        
-        # Re-iterate through valid members to output logs with percentages
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            # Re-iterate through valid members to output logs with percentages
+            log = self.logger
             try:
-                # Calculate this member's score percentage of total
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]:.3f}(norm：{normalized_waiting[i]:.3f}), "
-                    f"cache={cache_usage_values[i]:.3f}(norm：{normalized_cache[i]:.3f}), "
-                    f"score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, norm_waiting, cache, norm_cache, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, normalized_waiting, cache_usage_values, normalized_cache, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting:.3f}(norm：{norm_waiting:.3f}), "
+                        f"cache={cache:.3f}(norm：{norm_cache:.3f}), "
+                        f"score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}")
+                log.warning(f"Exception logging member {member}: {e}")
     
     def _calculate_s2_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """Calculate scores using S2 algorithm (S1 + running_req metric)"""
         # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
-        running_req_values = []
-        valid_members = []
-        
-        for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            running_req = metrics.get("running_req")
-            
-            if waiting_queue is None or cache_usage is None or running_req is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            running_req_values.append(running_req)
-            valid_members.append(member)
+        valid_members, (waiting_queue_values, cache_usage_values, running_req_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage", "running_req")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
+        w_a, w_b, w_g = mode_config.w_a, mode_config.w_b, mode_config.w_g
+        
         # Min-max normalize waiting queue values
         normalized_waiting = self._min_max_normalize(waiting_queue_values)
         
@@ -758,51 +932,31 @@ class ScoreCalculator:
         normalized_running = self._min_max_normalize(running_req_values)
         
         # Calculate score for each member
-        new_scores = []  # Store all new score values for sum calculation
-        old_scores = []  # Store all old score values for logging
+        # S2 algorithm: score = w_a * (1 - normalized_waiting) + w_b * (1 - cache_usage) + w_g * (1 - normalized_running)
+        # This way, smaller waiting_queue, cache_usage, and running_req result in higher scores
+        out, work = self._score_buffers(pool, len(valid_members))
+        score_values = _s2_score_kernel(normalized_waiting, normalized_cache, normalized_running,
+                                        w_a, w_b, w_g, out=out, work=work)
         
-        for i, member in enumerate(valid_members):
-            try:
-                # S2 algorithm: score = w_a * (1 - normalized_waiting) + w_b * (1 - cache_usage) + w_g * (1 - normalized_running)
-                # This way, smaller waiting_queue, cache_usage, and running_req result in higher scores
-                new_score = (
-                    mode_config.w_a * (1.0 - normalized_waiting[i]) +
-                    mode_config.w_b * (1.0 - normalized_cache[i]) +
-                    mode_config.w_g * (1.0 - normalized_running[i])
-                )
-                
-                # Ensure score is within reasonable range
-                new_score = max(0.0, min(1.0, new_score))
-                
-                # Atomic score update (assignment operations are atomic in Python)
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)  # Use original score
-                old_scores.append(member.score)  # Old score is also current score
-        
-        # Calculate total sum of all scores
-        total_score = sum(new_scores)
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        # Re-iterate through valid members to output logs with percentages
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            # Re-iterate through valid members to output logs with percentages
+            log = self.logger
             try:
-                # Calculate this member's score percentage of total
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]:.3f}(normalized：{normalized_waiting[i]:.3f}), "
-                    f"cache={cache_usage_values[i]:.3f}, running={running_req_values[i]:.3f}(normalized：{normalized_running[i]:.3f}), "
-                    f"score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, norm_waiting, cache, running, norm_running, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, normalized_waiting, cache_usage_values, running_req_values, normalized_running, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting:.3f}(normalized：{norm_waiting:.3f}), "
+                        f"cache={cache:.3f}, running={running:.3f}(normalized：{norm_running:.3f}), "
+                        f"score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}")
+                log.warning(f"Exception logging member {member}: {e}")
     
     def _calculate_s2_enhanced_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """
@@ -819,231 +973,123 @@ class ScoreCalculator:
         3. 使用对数缩放，对微小差异更敏感
         """
         # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
-        running_req_values = []
-        valid_members = []
-        
-        for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            running_req = metrics.get("running_req")
-            
-            if waiting_queue is None or cache_usage is None or running_req is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            running_req_values.append(running_req)
-            valid_members.append(member)
+        valid_members, (waiting_queue_values, cache_usage_values, running_req_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage", "running_req")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
+        w_a, w_b, w_g = mode_config.w_a, mode_config.w_b, mode_config.w_g
+        
         # Use specialized precise normalization for each metric type
         normalized_waiting = self._min_max_normalize(waiting_queue_values)
         normalized_cache = self._precise_cache_normalize(cache_usage_values)  # Use precise cache normalization
         normalized_running = self._precise_running_normalize(running_req_values)  # Use precise running normalization
         
         # Calculate score for each member
-        new_scores = []
-        old_scores = []
-        
-        for i, member in enumerate(valid_members):
-            try:
-                # S2 Enhanced: normalize all metrics to amplify differences
-                new_score = (
-                    mode_config.w_a * (1.0 - normalized_waiting[i]) +
-                    mode_config.w_b * (1.0 - normalized_cache[i]) +
-                    mode_config.w_g * (1.0 - normalized_running[i])
-                )
-                
-                new_score = max(0.0, min(1.0, new_score))
-                
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)
-                old_scores.append(member.score)
+        # S2 Enhanced: normalize all metrics to amplify differences
+        out, work = self._score_buffers(pool, len(valid_members))
+        score_values = _s2_score_kernel(normalized_waiting, normalized_cache, normalized_running,
+                                        w_a, w_b, w_g, out=out, work=work)
         
-        # Calculate total sum and log results
-        total_score = sum(new_scores)
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            log = self.logger
             try:
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]:.3f}(norm：{normalized_waiting[i]:.3f}), "
-                    f"cache={cache_usage_values[i]:.3f}(norm：{normalized_cache[i]:.3f}), "
-                    f"running={running_req_values[i]:.3f}(norm：{normalized_running[i]:.3f}), "
-                    f"score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, norm_waiting, cache, norm_cache, running, norm_running, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, normalized_waiting, cache_usage_values, normalized_cache, running_req_values, normalized_running, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting:.3f}(norm：{norm_waiting:.3f}), "
+                        f"cache={cache:.3f}(norm：{norm_cache:.3f}), "
+                        f"running={running:.3f}(norm：{norm_running:.3f}), "
+                        f"score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}")
+                log.warning(f"Exception logging member {member}: {e}")
     
     def _calculate_s2_nonlinear_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """Calculate scores using S2 Non-linear algorithm (with exponential amplification)"""
         # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
-        running_req_values = []
-        valid_members = []
-        
-        for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            running_req = metrics.get("running_req")
-            
-            if waiting_queue is None or cache_usage is None or running_req is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            running_req_values.append(running_req)
-            valid_members.append(member)
+        valid_members, (waiting_queue_values, cache_usage_values, running_req_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage", "running_req")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
+        w_a, w_b, w_g = mode_config.w_a, mode_config.w_b, mode_config.w_g
+        
         # Normalize all metrics
         normalized_waiting = self._min_max_normalize(waiting_queue_values)
         normalized_cache = self._min_max_normalize(cache_usage_values)
         normalized_running = self._min_max_normalize(running_req_values)
         
         # Calculate score for each member with non-linear transformation
-        new_scores = []
-        old_scores = []
+        # Apply exponential transformation to amplify differences
+        # Use power function to make small differences more pronounced
+        exp_factor = 2.0  # Can be configured
         
-        for i, member in enumerate(valid_members):
-            try:
-                # Apply exponential transformation to amplify differences
-                # Use power function to make small differences more pronounced
-                exp_factor = 2.0  # Can be configured
-                
-                waiting_contrib = mode_config.w_a * (1.0 - normalized_waiting[i]) ** exp_factor
-                cache_contrib = mode_config.w_b * (1.0 - normalized_cache[i]) ** exp_factor
-                running_contrib = mode_config.w_g * (1.0 - normalized_running[i]) ** exp_factor
-                
-                new_score = waiting_contrib + cache_contrib + running_contrib
-                new_score = max(0.0, min(1.0, new_score))
-                
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)
-                old_scores.append(member.score)
+        out, work = self._score_buffers(pool, len(valid_members))
+        terms = _complement_power(
+            _metric_matrix((normalized_waiting, normalized_cache, normalized_running), work), exp_factor
+        )
+        score_values = np.dot(np.array((w_a, w_b, w_g)), terms, out=out)
+        np.clip(score_values, 0.0, 1.0, out=score_values)
         
-        # Calculate total sum and log results
-        total_score = sum(new_scores)
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            log = self.logger
             try:
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]:.3f}(norm：{normalized_waiting[i]:.3f}), "
-                    f"cache={cache_usage_values[i]:.3f}(norm：{normalized_cache[i]:.3f}), "
-                    f"running={running_req_values[i]:.3f}(norm：{normalized_running[i]:.3f}), "
-                    f"score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, norm_waiting, cache, norm_cache, running, norm_running, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, normalized_waiting, cache_usage_values, normalized_cache, running_req_values, normalized_running, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting:.3f}(norm：{norm_waiting:.3f}), "
+                        f"cache={cache:.3f}(norm：{norm_cache:.3f}), "
+                        f"running={running:.3f}(norm：{norm_running:.3f}), "
+                        f"score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}")
+                log.warning(f"Exception logging member {member}: {e}")
     
     def _calculate_s2_adaptive_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """Calculate scores using S2 Adaptive algorithm (dynamic weight adjustment)"""
         # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
-        running_req_values = []
-        valid_members = []
-        
-        for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            running_req = metrics.get("running_req")
-            
-            if waiting_queue is None or cache_usage is None or running_req is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            running_req_values.append(running_req)
-            valid_members.append(member)
+        valid_members, (waiting_queue_values, cache_usage_values, running_req_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage", "running_req")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
+        w_a, w_b, w_g = mode_config.w_a, mode_config.w_b, mode_config.w_g
+        
         # Calculate coefficient of variation (CV) for each metric to determine importance
-        def coefficient_of_variation(values):
-            if len(values) <= 1:
-                return 0.0
-            mean = sum(values) / len(values)
-            if mean == 0:
-                return 0.0
-            variance = sum((x - mean) ** 2 for x in values) / len(values)
-            std_dev = math.sqrt(variance)
-            return std_dev / mean
-        
-        cv_waiting = coefficient_of_variation(waiting_queue_values)
-        cv_cache = coefficient_of_variation(cache_usage_values)
-        cv_running = coefficient_of_variation(running_req_values)
+        cv_waiting = _coefficient_of_variation(waiting_queue_values)
+        cv_cache = _coefficient_of_variation(cache_usage_values)
+        cv_running = _coefficient_of_variation(running_req_values)
         
         # Dynamically adjust weights based on variation
-        total_cv = cv_waiting + cv_cache + cv_running
-        if total_cv > 0:
-            # Give more weight to metrics with higher variation (more discriminative)
-            adaptive_w_a = mode_config.w_a * (1 + cv_waiting / total_cv)
-            adaptive_w_b = mode_config.w_b * (1 + cv_cache / total_cv)
-            adaptive_w_g = mode_config.w_g * (1 + cv_running / total_cv)
-            
-            # Normalize to ensure sum equals original sum
-            total_adaptive = adaptive_w_a + adaptive_w_b + adaptive_w_g
-            original_sum = mode_config.w_a + mode_config.w_b + mode_config.w_g
-            if total_adaptive > 0:
-                adaptive_w_a = adaptive_w_a * original_sum / total_adaptive
-                adaptive_w_b = adaptive_w_b * original_sum / total_adaptive
-                adaptive_w_g = adaptive_w_g * original_sum / total_adaptive
-        else:
-            adaptive_w_a = mode_config.w_a
-            adaptive_w_b = mode_config.w_b
-            adaptive_w_g = mode_config.w_g
+        adaptive_w_a, adaptive_w_b, adaptive_w_g = _adaptive_weights(
+            (w_a, w_b, w_g), (cv_waiting, cv_cache, cv_running)
+        )
         
-        self.logger.debug(f"Adaptive weights: w_a={adaptive_w_a:.3f}, w_b={adaptive_w_b:.3f}, w_g={adaptive_w_g:.3f} "
-                         f"(CV: waiting={cv_waiting:.3f}, cache={cv_cache:.3f}, running={cv_running:.3f})")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Adaptive weights: w_a={adaptive_w_a:.3f}, w_b={adaptive_w_b:.3f}, w_g={adaptive_w_g:.3f} "
+                             f"(CV: waiting={cv_waiting:.3f}, cache={cv_cache:.3f}, running={cv_running:.3f})")
         
         # Normalize all metrics
         normalized_waiting = self._min_max_normalize(waiting_queue_values)
@@ -1051,251 +1097,214 @@ class ScoreCalculator:
         normalized_running = self._min_max_normalize(running_req_values)
         
         # Calculate score for each member with adaptive weights
-        new_scores = []
-        old_scores = []
-        
-        for i, member in enumerate(valid_members):
-            try:
-                new_score = (
-                    adaptive_w_a * (1.0 - normalized_waiting[i]) +
-                    adaptive_w_b * (1.0 - normalized_cache[i]) +
-                    adaptive_w_g * (1.0 - normalized_running[i])
-                )
-                
-                new_score = max(0.0, min(1.0, new_score))
-                
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)
-                old_scores.append(member.score)
+        out, work = self._score_buffers(pool, len(valid_members))
+        score_values = _s2_score_kernel(normalized_waiting, normalized_cache, normalized_running,
+                                        adaptive_w_a, adaptive_w_b, adaptive_w_g, out=out, work=work)
         
-        # Calculate total sum and log results
-        total_score = sum(new_scores)
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            log = self.logger
             try:
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]:.3f}(norm：{normalized_waiting[i]:.3f}), "
-                    f"cache={cache_usage_values[i]:.3f}(norm：{normalized_cache[i]:.3f}), "
-                    f"running={running_req_values[i]:.3f}(norm：{normalized_running[i]:.3f}), "
-                    f"score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, norm_waiting, cache, norm_cache, running, norm_running, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, normalized_waiting, cache_usage_values, normalized_cache, running_req_values, normalized_running, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting:.3f}(norm：{norm_waiting:.3f}), "
+                        f"cache={cache:.3f}(norm：{norm_cache:.3f}), "
+                        f"running={running:.3f}(norm：{norm_running:.3f}), "
+                        f"score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}")
+                log.warning(f"Exception logging member {member}: {e}")
     
-    def _min_max_normalize(self, values: List[float]) -> List[float]:
+    def _min_max_normalize(self, values: List[float]) -> Sequence[float]:
         """Min-Max normalization"""
-        if not values:
+        if len(values) == 0:
             return []
         
         if len(values) == 1:
             return [0.0]  # When there's only one value, normalize to 0
         
-        min_val = min(values)
-        max_val = max(values)
+        if len(values) == 2:
+            # Two-node case: min-max reduces to a 0/1 split. Non-finite values take
+            # the array path, so NaN propagates as it does for larger pools
+            first, second = values
+            if math.isfinite(first) and math.isfinite(second):
+                if first == second:
+                    return [0.0, 0.0]
+                return [0.0, 1.0] if first < second else [1.0, 0.0]
+        
+        array = np.asarray(values, dtype=np.float64)
+        min_val = array.min()
+        max_val = array.max()
         
         if max_val == min_val:
             # All values are the same, normalize to 0
-            return [0.0] * len(values)
-        
-        normalized = []
-        for value in values:
-            norm_value = (value - min_val) / (max_val - min_val)
-            normalized.append(norm_value)
+            return np.zeros_like(array)
         
+        normalized = np.subtract(array, min_val)
+        normalized /= (max_val - min_val)
         return normalized
     
-    def _relative_ratio_normalize(self, values: List[float]) -> List[float]:
+    def _relative_ratio_normalize(self, values: List[float]) -> Sequence[float]:
         """Relative ratio normalization - preserves actual difference ratios"""
-        if not values:
+        if len(values) == 0:
             return []
         
         if len(values) == 1:
             return [0.5]  # Single value gets middle score
         
+        array = np.asarray(values, dtype=np.float64)
+        
         # Find min value (but avoid division by zero)
-        min_val = min(values)
+        min_val = array.min()
         if min_val == 0:
-            min_val = min([v for v in values if v > 0] + [0.001])  # Use smallest non-zero or 0.001
+            # Smallest positive value capped at 0.001, reduced in place without copying the positives out
+            min_val = array.min(where=array > 0, initial=0.001)
         
         # Calculate ratios relative to minimum
-        ratios = [val / min_val for val in values]
-        max_ratio = max(ratios)
+        ratios = array / min_val
+        max_ratio = ratios.max()
         
         # Normalize ratios to [0, 1] using logarithmic scaling
         if max_ratio > 1:
-            normalized = []
-            for ratio in ratios:
-                # Use log to compress large differences
-                norm_value = math.log(ratio) / math.log(max_ratio)
-                normalized.append(norm_value)
-            return normalized
+            # A zero or negative ratio has no log; fail like math.log does
+            if (ratios <= 0).any():
+                raise ValueError("math domain error")
+            # Use log to compress large differences
+            return np.log(ratios) / math.log(max_ratio)
         else:
-            return [0.0] * len(values)
+            return np.zeros_like(array)
     
-    def _exponential_difference_normalize(self, values: List[float], base: float = 2.0) -> List[float]:
+    def _exponential_difference_normalize(self, values: List[float], base: float = 2.0) -> Sequence[float]:
         """Exponential difference normalization - amplifies relative differences"""
-        if not values:
+        if len(values) == 0:
             return []
         
         if len(values) == 1:
             return [0.5]
         
+        array = np.asarray(values, dtype=np.float64)
+        
         # Calculate relative differences from mean
-        mean_val = sum(values) / len(values)
+        mean_val = array.mean()
         if mean_val == 0:
-            return [0.0] * len(values)
+            return np.zeros_like(array)
         
-        # Calculate relative deviations
-        relative_deviations = [(val - mean_val) / mean_val for val in values]
-        
-        # Apply exponential transformation
-        exp_values = [base ** deviation for deviation in relative_deviations]
+        # Calculate relative deviations and apply exponential transformation
+        exp_values = np.power(base, (array - mean_val) / mean_val)
         
         # Normalize to [0, 1]
-        min_exp = min(exp_values)
-        max_exp = max(exp_values)
+        min_exp = exp_values.min()
+        max_exp = exp_values.max()
         
         if max_exp == min_exp:
-            return [0.5] * len(values)
+            return np.full_like(array, 0.5)
         
-        normalized = [(exp_val - min_exp) / (max_exp - min_exp) for exp_val in exp_values]
-        return normalized
+        exp_values -= min_exp
+        exp_values /= (max_exp - min_exp)
+        return exp_values
     
-    def _sigmoid_difference_normalize(self, values: List[float], sensitivity: float = 5.0) -> List[float]:
+    def _sigmoid_difference_normalize(self, values: List[float], sensitivity: float = 5.0) -> Sequence[float]:
         """Sigmoid-based normalization - smooth transition with adjustable sensitivity"""
-        if not values:
+        if len(values) == 0:
             return []
         
         if len(values) == 1:
             return [0.5]
         
-        # Calculate mean and standard deviation
-        mean_val = sum(values) / len(values)
-        if len(values) < 2:
-            return [0.5] * len(values)
+        array = np.asarray(values, dtype=np.float64)
         
-        variance = sum((x - mean_val) ** 2 for x in values) / len(values)
+        # Calculate mean and standard deviation
+        mean_val = array.mean()
+        variance = array.var()
         std_dev = math.sqrt(variance) if variance > 0 else 1.0
         
-        # Apply sigmoid transformation
-        def sigmoid(x):
-            return 1 / (1 + math.exp(-x))
-        
-        normalized = []
-        for val in values:
-            # Standardize value
-            z_score = (val - mean_val) / std_dev if std_dev > 0 else 0
-            # Apply sigmoid with sensitivity adjustment
-            sigmoid_val = sigmoid(z_score * sensitivity)
-            normalized.append(sigmoid_val)
-        
-        return normalized
+        # Standardize values, then apply sigmoid with sensitivity adjustment
+        z_scores = (array - mean_val) / std_dev
+        return 1 / (1 + np.exp(-(z_scores * sensitivity)))
     
-    def _adaptive_cache_normalize(self, values: List[float]) -> List[float]:
+    def _adaptive_cache_normalize(self, values: List[float]) -> Sequence[float]:
         """Adaptive cache normalization - considers both absolute and relative differences"""
-        if not values:
+        if len(values) == 0:
             return []
         
         if len(values) == 1:
             return [0.5]
         
-        min_val = min(values)
-        max_val = max(values)
+        array = np.asarray(values, dtype=np.float64)
+        min_val = array.min()
+        max_val = array.max()
         
         if max_val == min_val:
-            return [0.5] * len(values)
+            return np.full_like(array, 0.5)
         
         # Method 1: Preserve relative ratios
         if min_val > 0:
-            # Calculate ratio-based scores
-            ratios = [val / min_val for val in values]
-            max_ratio = max(ratios)
+            # Use square root of the ratios to moderate extreme differences
+            sqrt_ratios = np.sqrt(array / min_val)
+            max_sqrt_ratio = sqrt_ratios.max()
             
-            # Use square root to moderate extreme differences
-            sqrt_ratios = [math.sqrt(ratio) for ratio in ratios]
-            max_sqrt_ratio = max(sqrt_ratios)
+            if max_sqrt_ratio <= 1:
+                return np.full_like(sqrt_ratios, 0.55)
             
             # Normalize sqrt ratios to [0.1, 1.0] to avoid complete elimination
-            normalized = []
-            for sqrt_ratio in sqrt_ratios:
-                norm_val = 0.1 + 0.9 * ((sqrt_ratio - 1) / (max_sqrt_ratio - 1)) if max_sqrt_ratio > 1 else 0.55
-                normalized.append(min(1.0, max(0.0, norm_val)))
-            
-            return normalized
+            sqrt_ratios -= 1
+            sqrt_ratios /= (max_sqrt_ratio - 1)
+            sqrt_ratios *= 0.9
+            sqrt_ratios += 0.1
+            return np.clip(sqrt_ratios, 0.0, 1.0, out=sqrt_ratios)
         else:
             # Fallback to min-max if any value is 0
             return self._min_max_normalize(values)
     
-    def _precise_cache_normalize(self, values: List[float]) -> List[float]:
+    def _precise_cache_normalize(self, values: List[float]) -> Sequence[float]:
         """
         精确cache归一化 - 专门解决两值情况下保留差异程度的问题
         使用多种策略组合来精确反映实际差异
         """
-        if not values:
+        if len(values) == 0:
             return []
         
         if len(values) == 1:
             return [0.5]  # Single value gets middle score
         
-        min_val = min(values)
-        max_val = max(values)
+        array = np.asarray(values, dtype=np.float64)
+        min_val = array.min()
+        max_val = array.max()
         
         if max_val == min_val:
-            return [0.5] * len(values)
+            return np.full_like(array, 0.5)
         
         # 策略1: 基于相对比例的对数缩放
         if min_val > 0:
-            ratios = [val / min_val for val in values]
-            max_ratio = max(ratios)
-            
             # 使用对数来压缩比例差异到合理范围
             # log_2(ratio) 可以将 2倍差异映射到1, 4倍差异映射到2, 8倍差异映射到3
-            log_ratios = [math.log2(ratio) for ratio in ratios]
-            max_log_ratio = max(log_ratios)
+            log_ratios = np.log2(array / min_val)
+            max_log_ratio = log_ratios.max()
             
             if max_log_ratio > 0:
                 # 将对数比例映射到 [0.2, 1.0] 范围，避免完全消除较差的选项
                 base_range = 0.8  # [0.2, 1.0] 的范围是0.8
-                normalized = []
-                for log_ratio in log_ratios:
-                    # 归一化到 [0, 1]，然后映射到 [0.2, 1.0]
-                    norm_val = 0.2 + base_range * (log_ratio / max_log_ratio)
-                    normalized.append(norm_val)
-                return normalized
-        
-        # 策略2: 基于标准差的缩放（备用方案）
-        mean_val = sum(values) / len(values)
-        variance = sum((x - mean_val) ** 2 for x in values) / len(values)
-        std_dev = math.sqrt(variance) if variance > 0 else 1.0
-        
-        # 使用3-sigma规则进行归一化
-        normalized = []
-        for val in values:
-            z_score = (val - mean_val) / (std_dev * 3) if std_dev > 0 else 0
-            # 将z-score转换为 [0.1, 0.9] 范围的概率
-            sigmoid_val = 1 / (1 + math.exp(-z_score * 2))  # 乘以2增加敏感度
-            # 映射到 [0.2, 1.0] 范围
-            norm_val = 0.2 + 0.8 * sigmoid_val
-            normalized.append(norm_val)
-        
-        return normalized
+                # 归一化到 [0, 1]，然后映射到 [0.2, 1.0]
+                log_ratios /= max_log_ratio
+                log_ratios *= base_range
+                log_ratios += 0.2
+                return log_ratios
+        
+        # 策略2: 基于标准差的缩放（备用方案），映射到 [0.2, 1.0] 范围
+        return _three_sigma_sigmoid(array, 0.2)
     
-    def _ratio_based_normalize(self, values: List[float]) -> List[float]:
+    def _ratio_based_normalize(self, values: List[float]) -> Sequence[float]:
         """
         基于比例的归一化 - 直接使用相对比例作为权重
         为两个值的情况专门优化
         """
-        if not values or len(values) == 1:
+        if len(values) <= 1:
             return [0.5] * len(values)
         
         if len(values) == 2:
@@ -1338,9 +1347,15 @@ class ScoreCalculator:
         return sorted_members
     
     def get_top_members(self, pool: Pool, top_n: int = 5) -> List[PoolMember]:
-        """Get top N members with highest scores"""
-        sorted_members = self.get_members_by_score(pool, descending=True)
-        return sorted_members[:top_n]
+        """Get top N members with highest scores
+        
+        Uses a bounded heap, O(N log top_n), instead of sorting the whole pool;
+        ties keep pool order exactly as the full sort does.
+        """
+        if top_n < 0:
+            # Keep list-slice semantics for negative counts
+            return self.get_members_by_score(pool, descending=True)[:top_n]
+        return heapq.nlargest(top_n, pool.members, key=attrgetter("score"))
     
     def get_pool_score_stats(self, pool: Pool) -> Dict[str, float]:
         """Get pool score statistics"""
@@ -1353,25 +1368,19 @@ class ScoreCalculator:
                 "std": 0.0
             }
         
-        scores = [member.score for member in pool.members]
-        count = len(scores)
-        max_score = max(scores)
-        min_score = min(scores)
-        avg_score = sum(scores) / count
-        
-        # Calculate standard deviation
-        variance = sum((score - avg_score) ** 2 for score in scores) / count
-        std_score = math.sqrt(variance)
+        count = len(pool.members)
+        scores = np.fromiter((member.score for member in pool.members), dtype=np.float64, count=count)
         
+        # Population standard deviation (ddof=0)
         return {
             "count": count,
-            "max": max_score,
-            "min": min_score,
-            "avg": avg_score,
-            "std": std_score
+            "max": float(scores.max()),
+            "min": float(scores.min()),
+            "avg": float(scores.mean()),
+            "std": float(scores.std())
         }
     
-    def _smooth_normalize(self, values: List[float]) -> List[float]:
+    def _smooth_normalize(self, values: List[float]) -> Sequence[float]:
         """
         平滑归一化 - 专门解决两节点[0,1]极值问题
         
@@ -1384,14 +1393,21 @@ class ScoreCalculator:
         - 两节点场景下的极值问题
         - 需要敏感反映微小差异但避免过度极化
         """
-        if not values or len(values) <= 1:
+        if len(values) <= 1:
             return [0.5] * len(values)
         
-        min_val = min(values)
-        max_val = max(values)
+        if len(values) == 2:
+            a, b = float(values[0]), float(values[1])
+            # 非有限值走数组路径，与多节点时NaN的传播方式一致
+            if math.isfinite(a) and math.isfinite(b):
+                return self._smooth_normalize_pair(a, b)
+        
+        array = np.asarray(values, dtype=np.float64)
+        min_val = array.min()
+        max_val = array.max()
         
         if max_val == min_val:
-            return [0.5] * len(values)
+            return np.full_like(array, 0.5)
         
         # 计算相对差异程度
         if min_val > 0:
@@ -1400,33 +1416,34 @@ class ScoreCalculator:
             relative_diff = max_val - min_val  # 绝对差异
         
         # 根据差异程度动态调整输出范围
-        if relative_diff < 0.1:
-            # 差异很小：[0.45, 0.55] - 几乎均衡分配
-            output_min, output_max = 0.45, 0.55
-        elif relative_diff < 0.3:
-            # 差异较小：[0.35, 0.65] - 轻微倾斜
-            output_min, output_max = 0.35, 0.65
-        elif relative_diff < 0.8:
-            # 差异中等：[0.25, 0.75] - 中等倾斜
-            output_min, output_max = 0.25, 0.75
-        elif relative_diff < 2.0:
-            # 差异较大：[0.15, 0.85] - 明显倾斜
-            output_min, output_max = 0.15, 0.85
-        else:
-            # 差异很大：[0.05, 0.95] - 强烈倾斜但仍避免完全极值
-            output_min, output_max = 0.05, 0.95
+        output_min, output_max = self._SMOOTH_RANGES[bisect_right(self._SMOOTH_THRESHOLDS, relative_diff)]
         
         # 执行归一化并映射到动态范围
-        normalized = []
-        for val in values:
-            # 标准min-max归一化到[0,1]
-            norm_val = (val - min_val) / (max_val - min_val)
-            # 映射到动态输出范围
-            smooth_val = output_min + norm_val * (output_max - output_min)
-            normalized.append(smooth_val)
-        
+        # 标准min-max归一化到[0,1]
+        normalized = np.subtract(array, min_val)
+        normalized /= (max_val - min_val)
+        # 映射到动态输出范围
+        normalized *= (output_max - output_min)
+        normalized += output_min
         return normalized
     
+    def _smooth_normalize_pair(self, a: float, b: float) -> List[float]:
+        """
+        两节点平滑归一化 - 与 _smooth_normalize 结果相同的标量快速路径
+        
+        两个值的min-max结果恰为0和1，直接取动态输出范围的两端。
+        调用方需保证a、b均为有限值。
+        """
+        if a == b:
+            return [0.5, 0.5]
+        
+        min_val, max_val = (a, b) if a < b else (b, a)
+        relative_diff = (max_val - min_val) / min_val if min_val > 0 else max_val - min_val
+        output_min, output_max = self._SMOOTH_RANGES[bisect_right(self._SMOOTH_THRESHOLDS, relative_diff)]
+        # 与向量路径相同的运算顺序：1 * (max - min) + min
+        high = (output_max - output_min) + output_min
+        return [output_min, high] if a < b else [high, output_min]
+    
     def _calculate_s1_adaptive_distribution_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """
         Calculate scores using S1 Adaptive Distribution algorithm
@@ -1438,86 +1455,53 @@ class ScoreCalculator:
         4. 对2节点和N节点都具有普适性
         """
         # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
-        valid_members = []
-        
-        for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            
-            if waiting_queue is None or cache_usage is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            valid_members.append(member)
+        valid_members, (waiting_queue_values, cache_usage_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
+        w_a, w_b = mode_config.w_a, mode_config.w_b
+        
         # 使用自适应分布归一化
-        normalized_waiting = self._adaptive_distribution_normalize(waiting_queue_values, "waiting_queue")
-        normalized_cache = self._adaptive_distribution_normalize(cache_usage_values, "cache_usage")
+        normalized_waiting, normalized_cache = self._adaptive_distribution_normalize_rows(
+            (waiting_queue_values, cache_usage_values), ("waiting_queue", "cache_usage")
+        )
         
         # Log normalization details for debugging
-        self.logger.debug(f"Adaptive distribution normalization results:")
-        self.logger.debug(f"  Waiting: {waiting_queue_values} → {[f'{v:.3f}' for v in normalized_waiting]}")
-        self.logger.debug(f"  Cache: {cache_usage_values} → {[f'{v:.3f}' for v in normalized_cache]}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Adaptive distribution normalization results:")
+            self.logger.debug(f"  Waiting: {waiting_queue_values.tolist()} → {[f'{v:.3f}' for v in normalized_waiting]}")
+            self.logger.debug(f"  Cache: {cache_usage_values.tolist()} → {[f'{v:.3f}' for v in normalized_cache]}")
         
         # Calculate score for each member
-        new_scores = []
-        old_scores = []
-        
-        for i, member in enumerate(valid_members):
-            try:
-                # S1 Adaptive Distribution algorithm: score = w_a * (1 - normalized_waiting) + w_b * (1 - normalized_cache)
-                new_score = (
-                    mode_config.w_a * (1.0 - normalized_waiting[i]) +
-                    mode_config.w_b * (1.0 - normalized_cache[i])
-                )
-                
-                # Ensure score is within reasonable range
-                new_score = max(0.0, min(1.0, new_score))
-                
-                # Atomic score update (assignment operations are atomic in Python)
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)
-                old_scores.append(member.score)
+        # S1 Adaptive Distribution algorithm: score = w_a * (1 - normalized_waiting) + w_b * (1 - normalized_cache)
+        out, work = self._score_buffers(pool, len(valid_members))
+        score_values = _s1_score_kernel(normalized_waiting, normalized_cache, w_a, w_b, out=out, work=work)
         
-        # Calculate total sum of all scores
-        total_score = sum(new_scores)
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        # Re-iterate through valid members to output logs with percentages
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            # Re-iterate through valid members to output logs with percentages
+            log = self.logger
             try:
-                # Calculate this member's score percentage of total
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]:.3f}(norm：{normalized_waiting[i]:.3f}), "
-                    f"cache={cache_usage_values[i]:.3f}(norm：{normalized_cache[i]:.3f}), "
-                    f"score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, norm_waiting, cache, norm_cache, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, normalized_waiting, cache_usage_values, normalized_cache, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting:.3f}(norm：{norm_waiting:.3f}), "
+                        f"cache={cache:.3f}(norm：{norm_cache:.3f}), "
+                        f"score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}")
+                log.warning(f"Exception logging member {member}: {e}")
     
-    def _adaptive_distribution_normalize(self, values: List[float], metric_type: str = "general") -> List[float]:
+    def _adaptive_distribution_normalize(self, values: Sequence[float], metric_type: str = "general") -> np.ndarray:
         """
         自适应分布归一化 - 基于数学统计原理的普适算法
         
@@ -1528,132 +1512,164 @@ class ScoreCalculator:
         4. 针对不同指标类型进行优化
         
         Args:
-            values: 待归一化的数值列表
+            values: 待归一化的数值（float64数组或数值列表）
             metric_type: 指标类型 ("waiting_queue", "cache_usage", "general")
         
         Returns:
-            归一化后的数值列表，范围动态调整但避免[0,1]极值
+            归一化后的float64数组，范围动态调整但避免[0,1]极值
         """
-        if not values or len(values) <= 1:
-            return [0.5] * len(values)
-        
-        # 1. 计算基础统计量
-        n = len(values)
-        mean_val = sum(values) / n
-        
-        if n < 2:
-            return [0.5] * len(values)
+        return self._adaptive_distribution_normalize_rows((values,), (metric_type,))[0]
+    
+    def _adaptive_distribution_normalize_rows(self, rows: Sequence[Sequence[float]],
+                                              metric_types: Sequence[str]) -> List[np.ndarray]:
+        """
+        批量自适应分布归一化 - 多个指标（每行一个）在同一个 (k, n) 矩阵上一次计算
         
-        # 计算方差和标准差
-        variance = sum((x - mean_val) ** 2 for x in values) / n
-        std_dev = math.sqrt(variance) if variance > 0 else 1e-6
+        每行的结果及日志输出顺序与逐个调用 _adaptive_distribution_normalize 相同。
         
-        # 计算变异系数 (Coefficient of Variation)
-        cv = std_dev / abs(mean_val) if abs(mean_val) > 1e-6 else std_dev
+        Args:
+            rows: 等长的待归一化数值序列，每个指标一行
+            metric_types: 每行对应的指标类型
         
-        # 计算偏度 (Skewness) - 衡量数据分布的对称性
-        if std_dev > 1e-6:
-            skewness = sum(((x - mean_val) / std_dev) ** 3 for x in values) / n
-        else:
-            skewness = 0.0
-        
-        # 2. 基于统计特征选择归一化策略
-        self.logger.debug(f"Distribution stats for {metric_type}: mean={mean_val:.3f}, std={std_dev:.3f}, cv={cv:.3f}, skew={skewness:.3f}")
-        
-        # 3. 自适应参数选择
-        if cv < 0.1:
-            # 低变异：数据相近，使用高敏感度
-            sensitivity = 3.0
-            output_range = (0.4, 0.6)  # 窄范围
-        elif cv < 0.3:
-            # 中等变异：平衡敏感度和稳定性
-            sensitivity = 2.0
-            output_range = (0.25, 0.75)
-        elif cv < 0.8:
-            # 高变异：使用中等敏感度
-            sensitivity = 1.5
-            output_range = (0.15, 0.85)
-        else:
-            # 极高变异：降低敏感度避免过度反应
-            sensitivity = 1.0
-            output_range = (0.1, 0.9)
-        
-        # 4. 针对特定指标类型的优化
-        if metric_type == "waiting_queue":
-            # waiting_queue通常有很大的动态范围，需要对数变换
-            if max(values) > 10 * min(values) and min(values) >= 0:
-                # 使用对数变换处理大动态范围
-                log_values = [math.log(max(1, x + 1)) for x in values]
-                return self._adaptive_distribution_normalize(log_values, "general")
-        elif metric_type == "cache_usage":
-            # cache_usage在[0,1]范围，需要更高敏感度
-            sensitivity *= 1.5
-            if cv < 0.2:
-                output_range = (0.35, 0.65)  # 对微小差异更敏感
-        
-        # 5. 改进的Sigmoid归一化
-        normalized = []
-        output_min, output_max = output_range
-        range_span = output_max - output_min
+        Returns:
+            每行归一化后的float64数组（调用方可自由修改，不影响缓存）
+        """
+        n = len(rows[0])
+        if n <= 1:
+            return [np.full(n, 0.5) for _ in rows]
+        
+        matrix = np.array(rows, dtype=np.float64)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        # 相同输入（指标未变化的调度周期）直接复用上次结果，并重放当时的日志
+        cache_key = (tuple(metric_types), debug, matrix.shape, matrix.tobytes())
+        with self._normalize_cache_lock:
+            cached = self._normalize_cache.get(cache_key)
+            if cached is not None:
+                self._normalize_cache.move_to_end(cache_key)
+        if cached is None:
+            # Computed outside the lock; a concurrent miss on the same key stores an identical result
+            cached = self._compute_adaptive_distribution_rows(matrix, list(metric_types), debug)
+            with self._normalize_cache_lock:
+                self._normalize_cache[cache_key] = cached
+                if len(self._normalize_cache) > self._NORMALIZE_CACHE_SIZE:
+                    self._normalize_cache.popitem(last=False)
+        
+        results, log_records = cached
+        for level, message in log_records:
+            if level == logging.WARNING:
+                self.logger.warning(message)
+            else:
+                self.logger.debug(message)
+        return [row.copy() for row in results]
+    
+    def _compute_adaptive_distribution_rows(self, matrix: np.ndarray, metric_types: List[str],
+                                            debug: bool) -> Tuple[Tuple[np.ndarray, ...], List[Tuple[int, str]]]:
+        """
+        批量自适应分布归一化的计算部分，不直接输出日志
         
-        for val in values:
-            # 标准化z-score
-            z_score = (val - mean_val) / std_dev if std_dev > 1e-6 else 0
-            
-            # 应用敏感度调整
-            adjusted_z = z_score * sensitivity
-            
-            # 改进的Sigmoid函数：避免极值但保持单调性
-            # 使用tanh函数，它比标准sigmoid在极值处更平缓
-            sigmoid_val = math.tanh(adjusted_z / 2) * 0.5 + 0.5
-            
-            # 映射到自适应输出范围
-            norm_val = output_min + sigmoid_val * range_span
-            
-            # 确保在合理范围内
-            norm_val = max(0.0, min(1.0, norm_val))
-            normalized.append(norm_val)
+        Args:
+            matrix: (k, n) 待归一化矩阵，waiting_queue行可能被原地对数变换
+            metric_types: 每行对应的指标类型
+            debug: 是否收集调试日志
         
-        # 6. 质量检查：确保保持相对顺序
-        original_order = sorted(range(len(values)), key=lambda i: values[i])
-        normalized_order = sorted(range(len(normalized)), key=lambda i: normalized[i])
+        Returns:
+            (每行只读的归一化结果数组, 按输出顺序排列的 (日志级别, 日志内容) 记录)
+        """
+        n = matrix.shape[1]
+        # 所有值相同（如空闲池的waiting_queue全为0）时结果恒为输出范围中点，无需排序检查
+        constant_rows = (matrix == matrix[:, :1]).all(axis=1)
+        # 每行的调试日志先收集，最后按逐行处理时的顺序输出
+        debug_lines = [[] for _ in metric_types] if debug else None
         
-        if original_order != normalized_order:
-            self.logger.warning(f"Order preservation failed for {metric_type}, falling back to rank-based normalization")
-            return self._rank_based_normalize(values, output_range)
+        # 1. 计算基础统计量
+        mean_vals, deviations, std_devs, cvs = _row_statistics(matrix)
+        if debug_lines is not None:
+            for r, metric_type in enumerate(metric_types):
+                debug_lines[r].append(_distribution_stats_line(metric_type, mean_vals[r], deviations[r], std_devs[r], cvs[r]))
+        
+        # 2. waiting_queue通常有很大的动态范围，需要对数变换，变换后按general处理
+        log_rows = []
+        for r, metric_type in enumerate(metric_types):
+            if metric_type == "waiting_queue":
+                row = matrix[r]
+                min_val = row.min()
+                if row.max() > 10 * min_val and min_val >= 0:
+                    # 使用对数变换处理大动态范围（min_val >= 0 时 row + 1 >= 1，无需再钳位），原地计算
+                    row += 1
+                    np.log(row, out=row)
+                    metric_types[r] = "general"
+                    log_rows.append(r)
+        
+        if log_rows:
+            log_stats = _row_statistics(matrix[log_rows])
+            mean_vals[log_rows], deviations[log_rows], std_devs[log_rows], cvs[log_rows] = log_stats
+            if debug_lines is not None:
+                for r in log_rows:
+                    debug_lines[r].append(_distribution_stats_line("general", mean_vals[r], deviations[r], std_devs[r], cvs[r]))
+        
+        # 3. 自适应参数选择，并针对特定指标类型优化
+        sensitivities = np.empty(len(metric_types))
+        output_ranges = []
+        for r, metric_type in enumerate(metric_types):
+            sensitivity, output_range = self._CV_PARAMETERS[bisect_right(self._CV_THRESHOLDS, cvs[r])]
+            if metric_type == "cache_usage":
+                # cache_usage在[0,1]范围，需要更高敏感度
+                sensitivity *= 1.5
+                if cvs[r] < 0.2:
+                    output_range = (0.35, 0.65)  # 对微小差异更敏感
+            sensitivities[r] = sensitivity
+            output_ranges.append(output_range)
+        
+        # 4. 改进的Sigmoid归一化
+        output_mins, output_maxs = np.array(output_ranges).T
+        if constant_rows.all():
+            # z-score全为0，tanh(0)映射到输出范围中点
+            normalized = np.clip(output_mins + 0.5 * (output_maxs - output_mins), 0.0, 1.0)[:, None]
+        else:
+            normalized = _adaptive_sigmoid_kernel(deviations, std_devs, sensitivities, output_mins, output_maxs)
+        
+        # 5. 质量检查：确保保持相对顺序（稳定排序，相同值保持原有先后）
+        results = []
+        log_records = []
+        for r, metric_type in enumerate(metric_types):
+            if debug_lines is not None:
+                log_records.extend((logging.DEBUG, line) for line in debug_lines[r])
+            
+            if constant_rows[r]:
+                row = np.full(n, normalized[r, 0])
+            elif n == 2 and std_devs[r] > 1e-6:
+                # 两节点z-score为±1，严格单调的tanh映射不会产生并列，顺序必然保持
+                row = normalized[r]
+            elif _preserves_order(matrix[r], normalized[r]):
+                row = normalized[r]
+            else:
+                log_records.append((logging.WARNING,
+                                    f"Order preservation failed for {metric_type}, falling back to rank-based normalization"))
+                row = np.array(self._rank_based_normalize(matrix[r], output_ranges[r]))
+            row.flags.writeable = False
+            results.append(row)
         
-        return normalized
+        return tuple(results), log_records
     
     def _rank_based_normalize(self, values: List[float], output_range: tuple = (0.1, 0.9)) -> List[float]:
         """
         基于排名的归一化 - 保证顺序保持的备用方案
         """
-        if not values:
+        if len(values) == 0:
             return []
         
         if len(values) == 1:
             return [0.5]
         
-        # 获取排名（处理相同值）
-        sorted_indices = sorted(range(len(values)), key=lambda i: values[i])
-        ranks = [0] * len(values)
-        
-        for rank, idx in enumerate(sorted_indices):
-            ranks[idx] = rank
+        # 获取排名（处理相同值：稳定排序，相同值按原有先后依次排名）
+        n = len(values)
+        ranks = np.empty(n, dtype=np.float64)
+        ranks[np.argsort(np.asarray(values, dtype=np.float64), kind="stable")] = np.arange(n)
         
         # 归一化排名到指定范围
-        max_rank = len(values) - 1
+        max_rank = n - 1
         output_min, output_max = output_range
-        
-        normalized = []
-        for rank in ranks:
-            if max_rank > 0:
-                norm_val = output_min + (rank / max_rank) * (output_max - output_min)
-            else:
-                norm_val = (output_min + output_max) / 2
-            normalized.append(norm_val)
-        
-        return normalized
+        return (output_min + (ranks / max_rank) * (output_max - output_min)).tolist()
     
     def _calculate_s1_advanced_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """
@@ -1666,119 +1682,63 @@ class ScoreCalculator:
         3. 数学上最优，适用于所有场景
         """
         # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
-        valid_members = []
-        
-        for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            
-            if waiting_queue is None or cache_usage is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            valid_members.append(member)
+        valid_members, (waiting_queue_values, cache_usage_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
+        w_a, w_b = mode_config.w_a, mode_config.w_b
+        
         # 1. 计算变异系数用于动态权重调整
-        def coefficient_of_variation(values):
-            if len(values) <= 1:
-                return 0.0
-            mean = sum(values) / len(values)
-            if abs(mean) < 1e-6:
-                return 0.0
-            variance = sum((x - mean) ** 2 for x in values) / len(values)
-            std_dev = math.sqrt(variance)
-            return std_dev / abs(mean)
-        
-        cv_waiting = coefficient_of_variation(waiting_queue_values)
-        cv_cache = coefficient_of_variation(cache_usage_values)
-        
-        # 2. 动态权重调整
-        total_cv = cv_waiting + cv_cache
-        if total_cv > 0:
-            # 给变异系数高的指标更大权重
-            adaptive_w_a = mode_config.w_a * (1 + cv_waiting / total_cv)
-            adaptive_w_b = mode_config.w_b * (1 + cv_cache / total_cv)
-            
-            # 归一化权重和
-            total_adaptive = adaptive_w_a + adaptive_w_b
-            original_sum = mode_config.w_a + mode_config.w_b
-            if total_adaptive > 0:
-                adaptive_w_a = adaptive_w_a * original_sum / total_adaptive
-                adaptive_w_b = adaptive_w_b * original_sum / total_adaptive
-        else:
-            adaptive_w_a = mode_config.w_a
-            adaptive_w_b = mode_config.w_b
+        cv_waiting = _abs_coefficient_of_variation(waiting_queue_values)
+        cv_cache = _abs_coefficient_of_variation(cache_usage_values)
+        
+        # 2. 动态权重调整：给变异系数高的指标更大权重
+        adaptive_w_a, adaptive_w_b = _adaptive_weights((w_a, w_b), (cv_waiting, cv_cache))
         
-        self.logger.debug(f"S1_ADVANCED 动态权重调整: w_a={mode_config.w_a:.3f}→{adaptive_w_a:.3f}, "
-                         f"w_b={mode_config.w_b:.3f}→{adaptive_w_b:.3f} "
-                         f"(CV: waiting={cv_waiting:.3f}, cache={cv_cache:.3f})")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"S1_ADVANCED 动态权重调整: w_a={w_a:.3f}→{adaptive_w_a:.3f}, "
+                             f"w_b={w_b:.3f}→{adaptive_w_b:.3f} "
+                             f"(CV: waiting={cv_waiting:.3f}, cache={cv_cache:.3f})")
         
         # 3. 自适应分布归一化
-        normalized_waiting = self._adaptive_distribution_normalize(waiting_queue_values, "waiting_queue")
-        normalized_cache = self._adaptive_distribution_normalize(cache_usage_values, "cache_usage")
+        normalized_waiting, normalized_cache = self._adaptive_distribution_normalize_rows(
+            (waiting_queue_values, cache_usage_values), ("waiting_queue", "cache_usage")
+        )
         
         # Log normalization details for debugging
-        self.logger.debug(f"S1_ADVANCED 自适应分布归一化结果:")
-        self.logger.debug(f"  Waiting: {waiting_queue_values} → {[f'{v:.3f}' for v in normalized_waiting]}")
-        self.logger.debug(f"  Cache: {cache_usage_values} → {[f'{v:.3f}' for v in normalized_cache]}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"S1_ADVANCED 自适应分布归一化结果:")
+            self.logger.debug(f"  Waiting: {waiting_queue_values.tolist()} → {[f'{v:.3f}' for v in normalized_waiting]}")
+            self.logger.debug(f"  Cache: {cache_usage_values.tolist()} → {[f'{v:.3f}' for v in normalized_cache]}")
         
         # 4. Calculate score for each member
-        new_scores = []
-        old_scores = []
+        # S1 Advanced algorithm: score = adaptive_w_a * (1 - normalized_waiting) + adaptive_w_b * (1 - normalized_cache)
+        out, work = self._score_buffers(pool, len(valid_members))
+        score_values = _s1_score_kernel(normalized_waiting, normalized_cache, adaptive_w_a, adaptive_w_b, out=out, work=work)
         
-        for i, member in enumerate(valid_members):
-            try:
-                # S1 Advanced algorithm: score = adaptive_w_a * (1 - normalized_waiting) + adaptive_w_b * (1 - normalized_cache)
-                new_score = (
-                    adaptive_w_a * (1.0 - normalized_waiting[i]) +
-                    adaptive_w_b * (1.0 - normalized_cache[i])
-                )
-                
-                # Ensure score is within reasonable range
-                new_score = max(0.0, min(1.0, new_score))
-                
-                # Atomic score update
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)
-                old_scores.append(member.score)
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        # Calculate total sum of all scores
-        total_score = sum(new_scores)
-        
-        # Re-iterate through valid members to output logs with percentages
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            # Re-iterate through valid members to output logs with percentages
+            log = self.logger
             try:
-                # Calculate this member's score percentage of total
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]:.3f}(norm：{normalized_waiting[i]:.3f}), "
-                    f"cache={cache_usage_values[i]:.3f}(norm：{normalized_cache[i]:.3f}), "
-                    f"score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, norm_waiting, cache, norm_cache, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, normalized_waiting, cache_usage_values, normalized_cache, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting:.3f}(norm：{norm_waiting:.3f}), "
+                        f"cache={cache:.3f}(norm：{norm_cache:.3f}), "
+                        f"score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}")
+                log.warning(f"Exception logging member {member}: {e}")
     
     def _calculate_s2_advanced_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """
@@ -1791,132 +1751,71 @@ class ScoreCalculator:
         3. 精确捕捉小差异，避免极值，适用于复杂场景
         """
         # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
-        running_req_values = []
-        valid_members = []
-        
-        for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            running_req = metrics.get("running_req")
-            
-            if waiting_queue is None or cache_usage is None or running_req is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            running_req_values.append(running_req)
-            valid_members.append(member)
+        valid_members, (waiting_queue_values, cache_usage_values, running_req_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage", "running_req")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
+        w_a, w_b, w_g = mode_config.w_a, mode_config.w_b, mode_config.w_g
+        
         # 1. 计算变异系数用于动态权重调整
-        def coefficient_of_variation(values):
-            if len(values) <= 1:
-                return 0.0
-            mean = sum(values) / len(values)
-            if abs(mean) < 1e-6:
-                return 0.0
-            variance = sum((x - mean) ** 2 for x in values) / len(values)
-            std_dev = math.sqrt(variance)
-            return std_dev / abs(mean)
-        
-        cv_waiting = coefficient_of_variation(waiting_queue_values)
-        cv_cache = coefficient_of_variation(cache_usage_values)
-        cv_running = coefficient_of_variation(running_req_values)
-        
-        # 2. 动态权重调整
-        total_cv = cv_waiting + cv_cache + cv_running
-        if total_cv > 0:
-            # 给变异系数高的指标更大权重
-            adaptive_w_a = mode_config.w_a * (1 + cv_waiting / total_cv)
-            adaptive_w_b = mode_config.w_b * (1 + cv_cache / total_cv)
-            adaptive_w_g = mode_config.w_g * (1 + cv_running / total_cv)
-            
-            # 归一化权重和
-            total_adaptive = adaptive_w_a + adaptive_w_b + adaptive_w_g
-            original_sum = mode_config.w_a + mode_config.w_b + mode_config.w_g
-            if total_adaptive > 0:
-                adaptive_w_a = adaptive_w_a * original_sum / total_adaptive
-                adaptive_w_b = adaptive_w_b * original_sum / total_adaptive
-                adaptive_w_g = adaptive_w_g * original_sum / total_adaptive
-        else:
-            adaptive_w_a = mode_config.w_a
-            adaptive_w_b = mode_config.w_b
-            adaptive_w_g = mode_config.w_g
+        cv_waiting = _abs_coefficient_of_variation(waiting_queue_values)
+        cv_cache = _abs_coefficient_of_variation(cache_usage_values)
+        cv_running = _abs_coefficient_of_variation(running_req_values)
         
-        self.logger.debug(f"S2_ADVANCED 动态权重调整: "
-                         f"w_a={mode_config.w_a:.3f}→{adaptive_w_a:.3f}, "
-                         f"w_b={mode_config.w_b:.3f}→{adaptive_w_b:.3f}, "
-                         f"w_g={mode_config.w_g:.3f}→{adaptive_w_g:.3f} "
-                         f"(CV: waiting={cv_waiting:.3f}, cache={cv_cache:.3f}, running={cv_running:.3f})")
+        # 2. 动态权重调整：给变异系数高的指标更大权重
+        adaptive_w_a, adaptive_w_b, adaptive_w_g = _adaptive_weights(
+            (w_a, w_b, w_g), (cv_waiting, cv_cache, cv_running)
+        )
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"S2_ADVANCED 动态权重调整: "
+                             f"w_a={w_a:.3f}→{adaptive_w_a:.3f}, "
+                             f"w_b={w_b:.3f}→{adaptive_w_b:.3f}, "
+                             f"w_g={w_g:.3f}→{adaptive_w_g:.3f} "
+                             f"(CV: waiting={cv_waiting:.3f}, cache={cv_cache:.3f}, running={cv_running:.3f})")
         
         # 3. 自适应分布归一化
-        normalized_waiting = self._adaptive_distribution_normalize(waiting_queue_values, "waiting_queue")
-        normalized_cache = self._adaptive_distribution_normalize(cache_usage_values, "cache_usage")
-        normalized_running = self._adaptive_distribution_normalize(running_req_values, "running_req")
+        normalized_waiting, normalized_cache, normalized_running = self._adaptive_distribution_normalize_rows(
+            (waiting_queue_values, cache_usage_values, running_req_values), ("waiting_queue", "cache_usage", "running_req")
+        )
         
         # Log normalization details for debugging
-        self.logger.debug(f"S2_ADVANCED 自适应分布归一化结果:")
-        self.logger.debug(f"  Waiting: {waiting_queue_values} → {[f'{v:.3f}' for v in normalized_waiting]}")
-        self.logger.debug(f"  Cache: {cache_usage_values} → {[f'{v:.3f}' for v in normalized_cache]}")
-        self.logger.debug(f"  Running: {running_req_values} → {[f'{v:.3f}' for v in normalized_running]}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"S2_ADVANCED 自适应分布归一化结果:")
+            self.logger.debug(f"  Waiting: {waiting_queue_values.tolist()} → {[f'{v:.3f}' for v in normalized_waiting]}")
+            self.logger.debug(f"  Cache: {cache_usage_values.tolist()} → {[f'{v:.3f}' for v in normalized_cache]}")
+            self.logger.debug(f"  Running: {running_req_values.tolist()} → {[f'{v:.3f}' for v in normalized_running]}")
         
         # 4. Calculate score for each member
-        new_scores = []
-        old_scores = []
+        # S2 Advanced algorithm: score = adaptive_w_a * (1 - normalized_waiting) + adaptive_w_b * (1 - normalized_cache) + adaptive_w_g * (1 - normalized_running)
+        out, work = self._score_buffers(pool, len(valid_members))
+        score_values = _s2_score_kernel(normalized_waiting, normalized_cache, normalized_running,
+                                        adaptive_w_a, adaptive_w_b, adaptive_w_g, out=out, work=work)
         
-        for i, member in enumerate(valid_members):
-            try:
-                # S2 Advanced algorithm: score = adaptive_w_a * (1 - normalized_waiting) + adaptive_w_b * (1 - normalized_cache) + adaptive_w_g * (1 - normalized_running)
-                new_score = (
-                    adaptive_w_a * (1.0 - normalized_waiting[i]) +
-                    adaptive_w_b * (1.0 - normalized_cache[i]) +
-                    adaptive_w_g * (1.0 - normalized_running[i])
-                )
-                
-                # Ensure score is within reasonable range
-                new_score = max(0.0, min(1.0, new_score))
-                
-                # Atomic score update
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)
-                old_scores.append(member.score)
-        
-        # Calculate total sum of all scores
-        total_score = sum(new_scores)
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        # Re-iterate through valid members to output logs with percentages
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            # Re-iterate through valid members to output logs with percentages
+            log = self.logger
             try:
-                # Calculate this member's score percentage of total
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]:.3f}(norm：{normalized_waiting[i]:.3f}), "
-                    f"cache={cache_usage_values[i]:.3f}(norm：{normalized_cache[i]:.3f}), "
-                    f"running={running_req_values[i]:.3f}(norm：{normalized_running[i]:.3f}), "
-                    f"score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, norm_waiting, cache, norm_cache, running, norm_running, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, normalized_waiting, cache_usage_values, normalized_cache, running_req_values, normalized_running, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting:.3f}(norm：{norm_waiting:.3f}), "
+                        f"cache={cache:.3f}(norm：{norm_cache:.3f}), "
+                        f"running={running:.3f}(norm：{norm_running:.3f}), "
+                        f"score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}") 
+                log.warning(f"Exception logging member {member}: {e}") 
     
     def _calculate_s1_dynamic_waiting_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """
@@ -1929,34 +1828,21 @@ class ScoreCalculator:
         4. 无等待时主要靠cache区分，有等待时逐步提升waiting权重
         """
         # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
-        valid_members = []
-        
-        for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            
-            if waiting_queue is None or cache_usage is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            valid_members.append(member)
+        valid_members, (waiting_queue_values, cache_usage_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
+        w_a, w_b = mode_config.w_a, mode_config.w_b
+        
         # 1. 计算整体waiting情况用于权重调整
-        max_waiting = max(waiting_queue_values)
-        avg_waiting = sum(waiting_queue_values) / len(waiting_queue_values)
+        # 在Python浮点列表上聚合，避免逐元素装箱NumPy标量
+        waiting_list = waiting_queue_values.tolist()
+        max_waiting = max(waiting_list)
+        avg_waiting = sum(waiting_list) / len(waiting_list)
         
         # 2. 渐进式权重调整函数
         # 使用tanh函数实现平滑过渡，避免硬阈值
@@ -1964,74 +1850,56 @@ class ScoreCalculator:
         steepness = mode_config.steepness  # 陡峭度：控制权重过渡的平滑程度
         
         # 计算权重调整因子 (0到1之间，0表示无等待，1表示重度等待)
-        waiting_intensity = math.tanh(max_waiting * steepness / transition_point)
+        waiting_intensity = _waiting_intensity(max_waiting, steepness, transition_point)
         
         # 3. 基于强度渐进调整权重
         # waiting_intensity=0时：更重视cache (0.2x waiting + 1.8x cache)
         # waiting_intensity=1时：更重视waiting (2.5x waiting + 0.3x cache)
-        min_w_a_factor = 0.2
-        max_w_a_factor = 2.5
-        min_w_b_factor = 1.8
-        max_w_b_factor = 0.3
+        (wa_min, wa_delta), (wb_min, wb_delta) = self._S1_DYNAMIC_WAITING_FACTORS
         
-        progressive_w_a = mode_config.w_a * (min_w_a_factor + (max_w_a_factor - min_w_a_factor) * waiting_intensity)
-        progressive_w_b = mode_config.w_b * (min_w_b_factor + (max_w_b_factor - min_w_b_factor) * waiting_intensity)
+        progressive_w_a = w_a * (wa_min + wa_delta * waiting_intensity)
+        progressive_w_b = w_b * (wb_min + wb_delta * waiting_intensity)
         
         # 归一化权重
         total_progressive = progressive_w_a + progressive_w_b
-        original_sum = mode_config.w_a + mode_config.w_b
+        original_sum = w_a + w_b
         if total_progressive > 0:
             progressive_w_a = progressive_w_a * original_sum / total_progressive
             progressive_w_b = progressive_w_b * original_sum / total_progressive
         
         self.logger.info(f"S1_DYNAMIC_WAITING: max_waiting={max_waiting}, avg_waiting={avg_waiting:.1f}, "
                         f"intensity={waiting_intensity:.3f}")
-        self.logger.debug(f"动态waiting权重: w_a={mode_config.w_a:.3f}→{progressive_w_a:.3f}, "
-                         f"w_b={mode_config.w_b:.3f}→{progressive_w_b:.3f}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"动态waiting权重: w_a={w_a:.3f}→{progressive_w_a:.3f}, "
+                             f"w_b={w_b:.3f}→{progressive_w_b:.3f}")
         
         # 4. 使用自适应分布归一化
-        normalized_waiting = self._adaptive_distribution_normalize(waiting_queue_values, "waiting_queue")
-        normalized_cache = self._adaptive_distribution_normalize(cache_usage_values, "cache_usage")
+        normalized_waiting, normalized_cache = self._adaptive_distribution_normalize_rows(
+            (waiting_queue_values, cache_usage_values), ("waiting_queue", "cache_usage")
+        )
         
         # 5. Calculate score for each member
-        new_scores = []
-        old_scores = []
+        out, work = self._score_buffers(pool, len(valid_members))
+        score_values = _s1_score_kernel(normalized_waiting, normalized_cache, progressive_w_a, progressive_w_b, out=out, work=work)
         
-        for i, member in enumerate(valid_members):
-            try:
-                new_score = (
-                    progressive_w_a * (1.0 - normalized_waiting[i]) +
-                    progressive_w_b * (1.0 - normalized_cache[i])
-                )
-                
-                new_score = max(0.0, min(1.0, new_score))
-                
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)
-                old_scores.append(member.score)
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        # Calculate total sum and log results
-        total_score = sum(new_scores)
-        
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            log = self.logger
             try:
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]:.3f}(norm：{normalized_waiting[i]:.3f}), "
-                    f"cache={cache_usage_values[i]:.3f}(norm：{normalized_cache[i]:.3f}), "
-                    f"score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, norm_waiting, cache, norm_cache, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, normalized_waiting, cache_usage_values, normalized_cache, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting:.3f}(norm：{norm_waiting:.3f}), "
+                        f"cache={cache:.3f}(norm：{norm_cache:.3f}), "
+                        f"score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}")
+                log.warning(f"Exception logging member {member}: {e}")
     
     def _calculate_s2_dynamic_waiting_scores(self, pool: Pool, mode_config: ModeConfig) -> None:
         """
@@ -2044,37 +1912,21 @@ class ScoreCalculator:
         4. 在无等待时主要靠cache和running区分，有等待时逐步提升waiting权重
         """
         # Collect metrics from all members
-        waiting_queue_values = []
-        cache_usage_values = []
-        running_req_values = []
-        valid_members = []
-        
-        for member in pool.members:
-            metrics = member.metrics
-            if not metrics:
-                self.logger.warning(f"Member {member} has no metrics data, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue = metrics.get("waiting_queue")
-            cache_usage = metrics.get("cache_usage")
-            running_req = metrics.get("running_req")
-            
-            if waiting_queue is None or cache_usage is None or running_req is None:
-                self.logger.warning(f"Member {member} missing key metrics, keeping original score: {member.score:.3f}")
-                continue
-            
-            waiting_queue_values.append(waiting_queue)
-            cache_usage_values.append(cache_usage)
-            running_req_values.append(running_req)
-            valid_members.append(member)
+        valid_members, (waiting_queue_values, cache_usage_values, running_req_values) = self._collect_metrics(
+            pool, ("waiting_queue", "cache_usage", "running_req")
+        )
         
         if not valid_members:
             self.logger.warning(f"Pool {pool.name} has no valid members for score calculation, all members keep original scores")
             return
         
+        w_a, w_b, w_g = mode_config.w_a, mode_config.w_b, mode_config.w_g
+        
         # 1. 计算整体waiting情况用于权重调整
-        max_waiting = max(waiting_queue_values)
-        avg_waiting = sum(waiting_queue_values) / len(waiting_queue_values)
+        # 在Python浮点列表上聚合，避免逐元素装箱NumPy标量
+        waiting_list = waiting_queue_values.tolist()
+        max_waiting = max(waiting_list)
+        avg_waiting = sum(waiting_list) / len(waiting_list)
         
         # 2. 渐进式权重调整函数（三指标版本）
         # 使用tanh函数实现平滑过渡，避免硬阈值
@@ -2082,25 +1934,20 @@ class ScoreCalculator:
         steepness = mode_config.steepness  # 陡峭度：控制权重过渡的平滑程度
         
         # 计算权重调整因子 (0到1之间，0表示无等待，1表示重度等待)
-        waiting_intensity = math.tanh(max_waiting * steepness / transition_point)
+        waiting_intensity = _waiting_intensity(max_waiting, steepness, transition_point)
         
         # 3. 基于强度渐进调整三个权重
         # waiting_intensity=0时：更重视cache和running (0.1x waiting + 1.5x cache + 1.4x running)
         # waiting_intensity=1时：更重视waiting (2.5x waiting + 0.4x cache + 0.6x running)
-        min_w_a_factor = 0.1  # waiting最小权重因子
-        max_w_a_factor = 2.5  # waiting最大权重因子
-        min_w_b_factor = 1.5  # cache最小权重因子
-        max_w_b_factor = 0.4  # cache最大权重因子
-        min_w_g_factor = 1.4  # running最小权重因子
-        max_w_g_factor = 0.6  # running最大权重因子
+        (wa_min, wa_delta), (wb_min, wb_delta), (wg_min, wg_delta) = self._S2_DYNAMIC_WAITING_FACTORS
         
-        progressive_w_a = mode_config.w_a * (min_w_a_factor + (max_w_a_factor - min_w_a_factor) * waiting_intensity)
-        progressive_w_b = mode_config.w_b * (min_w_b_factor + (max_w_b_factor - min_w_b_factor) * waiting_intensity)
-        progressive_w_g = mode_config.w_g * (min_w_g_factor + (max_w_g_factor - min_w_g_factor) * waiting_intensity)
+        progressive_w_a = w_a * (wa_min + wa_delta * waiting_intensity)
+        progressive_w_b = w_b * (wb_min + wb_delta * waiting_intensity)
+        progressive_w_g = w_g * (wg_min + wg_delta * waiting_intensity)
         
         # 归一化权重
         total_progressive = progressive_w_a + progressive_w_b + progressive_w_g
-        original_sum = mode_config.w_a + mode_config.w_b + mode_config.w_g
+        original_sum = w_a + w_b + w_g
         if total_progressive > 0:
             progressive_w_a = progressive_w_a * original_sum / total_progressive
             progressive_w_b = progressive_w_b * original_sum / total_progressive
@@ -2108,58 +1955,42 @@ class ScoreCalculator:
         
         self.logger.info(f"S2_DYNAMIC_WAITING: max_waiting={max_waiting}, avg_waiting={avg_waiting:.1f}, "
                         f"intensity={waiting_intensity:.3f}")
-        self.logger.debug(f"动态waiting权重(三指标): w_a={mode_config.w_a:.3f}→{progressive_w_a:.3f}, "
-                         f"w_b={mode_config.w_b:.3f}→{progressive_w_b:.3f}, "
-                         f"w_g={mode_config.w_g:.3f}→{progressive_w_g:.3f}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"动态waiting权重(三指标): w_a={w_a:.3f}→{progressive_w_a:.3f}, "
+                             f"w_b={w_b:.3f}→{progressive_w_b:.3f}, "
+                             f"w_g={w_g:.3f}→{progressive_w_g:.3f}")
         
         # 4. 使用自适应分布归一化
-        normalized_waiting = self._adaptive_distribution_normalize(waiting_queue_values, "waiting_queue")
-        normalized_cache = self._adaptive_distribution_normalize(cache_usage_values, "cache_usage")
-        normalized_running = self._adaptive_distribution_normalize(running_req_values, "running_req")
+        normalized_waiting, normalized_cache, normalized_running = self._adaptive_distribution_normalize_rows(
+            (waiting_queue_values, cache_usage_values, running_req_values), ("waiting_queue", "cache_usage", "running_req")
+        )
         
         # 5. Calculate score for each member
-        new_scores = []
-        old_scores = []
+        out, work = self._score_buffers(pool, len(valid_members))
+        score_values = _s2_score_kernel(normalized_waiting, normalized_cache, normalized_running,
+                                        progressive_w_a, progressive_w_b, progressive_w_g, out=out, work=work)
         
-        for i, member in enumerate(valid_members):
-            try:
-                new_score = (
-                    progressive_w_a * (1.0 - normalized_waiting[i]) +
-                    progressive_w_b * (1.0 - normalized_cache[i]) +
-                    progressive_w_g * (1.0 - normalized_running[i])
-                )
-                
-                new_score = max(0.0, min(1.0, new_score))
-                
-                old_score = member.score
-                member.score = new_score
-                
-                new_scores.append(new_score)
-                old_scores.append(old_score)
-                
-            except Exception as e:
-                self.logger.warning(f"Exception calculating score for member {member}: {e}, keeping original score: {member.score:.3f}")
-                new_scores.append(member.score)
-                old_scores.append(member.score)
-        
-        # Calculate total sum and log results
-        total_score = sum(new_scores)
+        old_scores, new_scores = self._assign_scores(valid_members, score_values)
         
-        for i, member in enumerate(valid_members):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Each member's share of the total score, in percent
+            score_ratios = _score_percentages(new_scores)
+            
+            log = self.logger
             try:
-                score_ratio = (new_scores[i] / total_score * 100) if total_score > 0 else 0.0
-                
-                self.logger.debug(
-                    f"Member {member}: waiting={waiting_queue_values[i]}(norm：{normalized_waiting[i]:.3f}), "
-                    f"cache={cache_usage_values[i]:.3f}(norm：{normalized_cache[i]:.3f}), "
-                    f"running={running_req_values[i]}(norm：{normalized_running[i]:.3f}), "
-                    f"score={old_scores[i]:.3f}→{new_scores[i]:.3f}({score_ratio:.1f}%)"
-                )
-                
+                for member, waiting, norm_waiting, cache, norm_cache, running, norm_running, old_score, new_score, score_ratio in zip(
+                    valid_members, waiting_queue_values, normalized_waiting, cache_usage_values, normalized_cache, running_req_values, normalized_running, old_scores, new_scores, score_ratios
+                ):
+                    log.debug(
+                        f"Member {member}: waiting={waiting}(norm：{norm_waiting:.3f}), "
+                        f"cache={cache:.3f}(norm：{norm_cache:.3f}), "
+                        f"running={running}(norm：{norm_running:.3f}), "
+                        f"score={old_score:.3f}→{new_score:.3f}({score_ratio:.1f}%)"
+                    )
             except Exception as e:
-                self.logger.warning(f"Exception logging member {member}: {e}")
+                log.warning(f"Exception logging member {member}: {e}")
     
-    def _precise_running_normalize(self, values: List[float]) -> List[float]:
+    def _precise_running_normalize(self, values: List[float]) -> Sequence[float]:
         """
         精确running_req归一化 - 专门处理正在运行请求数的归一化
         
@@ -2169,55 +2000,51 @@ class ScoreCalculator:
         3. 避免极值，保持较差选项的竞争力
         4. 适用于各种running请求分布情况
         """
-        if not values:
+        if len(values) == 0:
             return []
         
         if len(values) == 1:
             return [0.5]  # Single value gets middle score
         
-        min_val = min(values)
-        max_val = max(values)
+        if len(values) == 2:
+            # 两节点快速路径：对数比例恰为0和最大值，结果只取决于一次log2
+            # 非有限值走数组路径，与多节点时NaN的传播方式一致
+            a, b = float(values[0]), float(values[1])
+            if math.isfinite(a) and math.isfinite(b):
+                if a == b:
+                    return [0.5, 0.5]
+                min_val, max_val = (a, b) if a < b else (b, a)
+                if min_val >= 0:
+                    max_log_ratio = math.log2((max_val + 1) / (min_val + 1))
+                    if max_log_ratio > 0:
+                        high = max_log_ratio * (0.8 / max_log_ratio) + 0.15
+                        return [0.15, high] if a < b else [high, 0.15]
+        
+        array = np.asarray(values, dtype=np.float64)
+        min_val = array.min()
+        max_val = array.max()
         
         if max_val == min_val:
-            return [0.5] * len(values)
+            return np.full_like(array, 0.5)
         
         # 策略1: 基于相对比例的对数缩放（适用于running_req）
         if min_val >= 0:  # running_req可以为0
-            # 为了处理0值，给所有值加1
-            adjusted_values = [val + 1 for val in values]
-            min_adjusted = min(adjusted_values)
-            
-            ratios = [val / min_adjusted for val in adjusted_values]
-            max_ratio = max(ratios)
+            # 为了处理0值，给所有值加1（新数组，后续步骤原地计算）
+            log_ratios = array + 1
             
             # 使用对数来压缩比例差异
-            log_ratios = [math.log2(ratio) for ratio in ratios]
-            max_log_ratio = max(log_ratios)
+            log_ratios /= (min_val + 1)
+            np.log2(log_ratios, out=log_ratios)
+            max_log_ratio = log_ratios.max()
             
             if max_log_ratio > 0:
                 # 将对数比例映射到 [0.15, 0.95] 范围
                 # running_req差异通常比cache更明显，所以范围稍大
                 base_range = 0.8  # [0.15, 0.95] 的范围是0.8
-                normalized = []
-                for log_ratio in log_ratios:
-                    # 归一化到 [0, 1]，然后映射到 [0.15, 0.95]
-                    norm_val = 0.15 + base_range * (log_ratio / max_log_ratio)
-                    normalized.append(norm_val)
-                return normalized
-        
-        # 策略2: 基于标准差的缩放（备用方案）
-        mean_val = sum(values) / len(values)
-        variance = sum((x - mean_val) ** 2 for x in values) / len(values)
-        std_dev = math.sqrt(variance) if variance > 0 else 1.0
+                # 归一化到 [0, 1]，然后映射到 [0.15, 0.95]；缩放系数只计算一次
+                log_ratios *= base_range / max_log_ratio
+                log_ratios += 0.15
+                return log_ratios
         
-        # 使用3-sigma规则进行归一化
-        normalized = []
-        for val in values:
-            z_score = (val - mean_val) / (std_dev * 3) if std_dev > 0 else 0
-            # 将z-score转换为概率
-            sigmoid_val = 1 / (1 + math.exp(-z_score * 2))  # 乘以2增加敏感度
-            # 映射到 [0.15, 0.95] 范围
-            norm_val = 0.15 + 0.8 * sigmoid_val
-            normalized.append(norm_val)
-        
-        return normalized
\ No newline at end of file
+        # 策略2: 基于标准差的缩放（备用方案），映射到 [0.15, 0.95] 范围
+        return _three_sigma_sigmoid(array, 0.15)
@@ -8,7 +8,8 @@ import signal
 import sys
 import os
 import hashlib
-from typing import Dict, List, Optional
+from enum import IntFlag
+from typing import Dict, List, Optional, Set, Tuple
 from pathlib import Path
 
 # Add project root directory to Python path
@@ -19,7 +20,7 @@ from utils.logger import init_logger, get_logger, LogLevel
 from utils.exceptions import ConfigurationError, F5ApiError, MetricsCollectionError
 from config.config_loader import load_config, get_config_loader, AppConfig, PoolConfig
 from core.models import (
-    Pool, PoolMember, EngineType, add_or_update_pool, get_all_pools, get_pool_by_key, POOLS,
+    Pool, PoolMember, EngineType, add_or_update_pool, get_all_pools, get_pool_by_key, format_pool_key, POOLS,
     initialize_engine_metrics_candidates, refresh_engine_metrics_candidates, 
     clear_all_pools_metrics_key_cache, get_candidates_summary
 )
@@ -35,12 +36,93 @@ from api.server import create_api_server
 _scheduler_app_instance = None
 
 
+# Consecutive serious fetch failures after which a Pool is removed from memory
+POOL_FAILURE_THRESHOLD = 5
+
+# Maximum number of concurrent F5 pool member requests per fetch cycle
+POOL_FETCH_CONCURRENCY = 16
+
+# Time a changed configuration file must stay untouched before it is hashed;
+# editors and kubectl often write and rename in several quick steps
+CONFIG_CHANGE_SETTLE_SECONDS = 0.2
+
+# Read size used when hashing the configuration file
+_CONFIG_HASH_CHUNK_SIZE = 64 * 1024
+
+
+def _config_file_digest(config_file: str) -> bytes:
+    """Content digest of the configuration file, used only for change detection
+    
+    Not security relevant, so BLAKE2b with a 16-byte digest is used (faster than
+    SHA-256) and the raw digest is compared without hex encoding.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(config_file, 'rb') as f:
+        # Stream in fixed-size chunks so memory stays bounded even for an unexpectedly large file
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        for chunk in iter(lambda: f.read(_CONFIG_HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _stat_config_file(config_file: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of the configuration file, or None if it does not exist"""
+    try:
+        stat_result = os.stat(config_file)
+    except FileNotFoundError:
+        return None
+    return stat_result.st_mtime_ns, stat_result.st_size
+
+
+def _digest_if_unchanged(config_file: str, mtime_ns: int, size: int) -> Optional[bytes]:
+    """Hash the configuration file if it still has the given mtime and size
+    
+    Returns None when the file changed again (a write is still in progress) or
+    disappeared, so a partially written file is never hashed.
+    """
+    if _stat_config_file(config_file) != (mtime_ns, size):
+        return None
+    return _config_file_digest(config_file)
+
+
+class ConfigChange(IntFlag):
+    """Configuration sections changed by a hot reload, as a bit set"""
+    GLOBAL = 1 << 0
+    F5 = 1 << 1
+    SCHEDULER = 1 << 2
+    MODES = 1 << 3
+    POOLS = 1 << 4
+    ENGINE_METRICS_KEYS = 1 << 5
+    GLOBAL_INTERVAL = 1 << 6
+    GLOBAL_LOG = 1 << 7
+    GLOBAL_API_PORT = 1 << 8
+    GLOBAL_API_HOST = 1 << 9
+    SCHEDULER_POOL_INTERVAL = 1 << 10
+    SCHEDULER_METRICS_INTERVAL = 1 << 11
+
+
+def _advance_deadline(deadline: float, interval: float, now: float) -> Tuple[float, int]:
+    """Next deadline of a fixed-rate schedule
+    
+    Returns:
+        (next_deadline, skipped) where skipped is the number of ticks dropped
+        because the previous run overran them
+    """
+    deadline += interval
+    if deadline >= now or interval <= 0:
+        return deadline, 0
+    skipped = int((now - deadline) // interval) + 1
+    return deadline + skipped * interval, skipped
+
+
 class ConfigHotReloader:
     """Configuration file hot reload detector"""
     
     def __init__(self, config_file: str):
         self.config_file = config_file
-        self.last_mtime = None
+        self.last_mtime_ns = None
+        self.last_size = None
         self.last_hash = None
         self.logger = get_logger()
         self.initialized = False
@@ -48,10 +130,13 @@ class ConfigHotReloader:
     async def _initialize_baseline(self):
         """Initialize baseline values (establish baseline on first call, not considered as change)"""
         try:
-            if os.path.exists(self.config_file):
-                self.last_mtime = os.path.getmtime(self.config_file)
-                with open(self.config_file, 'rb') as f:
-                    self.last_hash = hashlib.sha256(f.read()).hexdigest()
+            stat = await asyncio.to_thread(_stat_config_file, self.config_file)
+            if stat is None:
+                return
+            current_hash = await asyncio.to_thread(_digest_if_unchanged, self.config_file, *stat)
+            if current_hash is not None:
+                self.last_mtime_ns, self.last_size = stat
+                self.last_hash = current_hash
                 self.initialized = True
                 self.logger.debug("Configuration file baseline established")
         except Exception as e:
@@ -65,24 +150,30 @@ class ConfigHotReloader:
                 await self._initialize_baseline()
                 return False
                 
-            # 1. Check if file exists
-            if not os.path.exists(self.config_file):
+            # 1. Stat the file (file I/O runs off the event loop)
+            stat = await asyncio.to_thread(_stat_config_file, self.config_file)
+            
+            # 2. File missing, or unchanged modification time and size
+            if stat is None:
                 return False
-                
-            # 2. Check file modification time
-            current_mtime = os.path.getmtime(self.config_file)
-            if self.last_mtime is not None and current_mtime <= self.last_mtime:
+            mtime_ns, size = stat
+            if mtime_ns <= self.last_mtime_ns and size == self.last_size:
                 return False
-                
-            # 3. Check file content hash
-            with open(self.config_file, 'rb') as f:
-                current_hash = hashlib.sha256(f.read()).hexdigest()
-                
+            
+            # 3. Let the write settle, then hash only if the file did not change meanwhile;
+            #    otherwise leave the recorded state alone so the next poll retries
+            await asyncio.sleep(CONFIG_CHANGE_SETTLE_SECONDS)
+            current_hash = await asyncio.to_thread(_digest_if_unchanged, self.config_file, mtime_ns, size)
+            if current_hash is None:
+                return False
+            
+            # 4. Record new timestamp and size (also when only touched, so the
+            #    unchanged content is not hashed again on every poll)
+            self.last_mtime_ns, self.last_size = mtime_ns, size
             if self.last_hash == current_hash:
                 return False
                 
-            # 4. Record new timestamp and hash
-            self.last_mtime = current_mtime
+            # 5. Record new hash
             self.last_hash = current_hash
             return True
             
@@ -103,7 +194,10 @@ class SchedulerApp:
         self.score_calculator: Optional[ScoreCalculator] = None
         self.api_server = None
         self.running = False
-        self.tasks: List[asyncio.Task] = []
+        # Background tasks by name, e.g. "pool_fetch"
+        self.tasks: Dict[str, asyncio.Task] = {}
+        # Replaced tasks that were cancelled but have not finished yet
+        self._retiring_tasks: Set[asyncio.Task] = set()
         # Configuration hot reloader
         self.config_hot_reloader = None
         # API key management components
@@ -197,34 +291,39 @@ class SchedulerApp:
             self.logger.error(f"Configuration validation failed: {e}")
             return False
 
-    def _analyze_config_changes(self, old_config: AppConfig, new_config: AppConfig) -> Dict[str, bool]:
+    def _analyze_config_changes(self, old_config: AppConfig, new_config: AppConfig) -> ConfigChange:
         """Analyze configuration changes"""
-        changes = {
-            'global': old_config.global_config != new_config.global_config,
-            'f5': old_config.f5 != new_config.f5,
-            'scheduler': old_config.scheduler != new_config.scheduler,
-            'modes': old_config.modes != new_config.modes,
-            'pools': old_config.pools != new_config.pools,
-            'engine_metrics_keys': old_config.engine_metrics_keys != new_config.engine_metrics_keys,
-        }
+        changes = ConfigChange(0)
+        if old_config.global_config != new_config.global_config:
+            changes |= ConfigChange.GLOBAL
+        if old_config.f5 != new_config.f5:
+            changes |= ConfigChange.F5
+        if old_config.scheduler != new_config.scheduler:
+            changes |= ConfigChange.SCHEDULER
+        if old_config.modes != new_config.modes:
+            changes |= ConfigChange.MODES
+        if old_config.pools != new_config.pools:
+            changes |= ConfigChange.POOLS
+        if old_config.engine_metrics_keys != new_config.engine_metrics_keys:
+            changes |= ConfigChange.ENGINE_METRICS_KEYS
         
         # Detailed analysis of global configuration changes
-        if changes['global']:
-            changes['global_interval'] = (old_config.global_config.interval != 
-                                        new_config.global_config.interval)
-            changes['global_log'] = (old_config.global_config.log_level != 
-                                   new_config.global_config.log_level)
-            changes['global_api_port'] = (old_config.global_config.api_port != 
-                                         new_config.global_config.api_port)
-            changes['global_api_host'] = (old_config.global_config.api_host != 
-                                         new_config.global_config.api_host)
+        if changes & ConfigChange.GLOBAL:
+            if old_config.global_config.interval != new_config.global_config.interval:
+                changes |= ConfigChange.GLOBAL_INTERVAL
+            if old_config.global_config.log_level != new_config.global_config.log_level:
+                changes |= ConfigChange.GLOBAL_LOG
+            if old_config.global_config.api_port != new_config.global_config.api_port:
+                changes |= ConfigChange.GLOBAL_API_PORT
+            if old_config.global_config.api_host != new_config.global_config.api_host:
+                changes |= ConfigChange.GLOBAL_API_HOST
         
         # Detailed analysis of scheduler configuration changes
-        if changes['scheduler']:
-            changes['scheduler_pool_interval'] = (old_config.scheduler.pool_fetch_interval != 
-                                                new_config.scheduler.pool_fetch_interval)
-            changes['scheduler_metrics_interval'] = (old_config.scheduler.metrics_fetch_interval != 
-                                                   new_config.scheduler.metrics_fetch_interval)
+        if changes & ConfigChange.SCHEDULER:
+            if old_config.scheduler.pool_fetch_interval != new_config.scheduler.pool_fetch_interval:
+                changes |= ConfigChange.SCHEDULER_POOL_INTERVAL
+            if old_config.scheduler.metrics_fetch_interval != new_config.scheduler.metrics_fetch_interval:
+                changes |= ConfigChange.SCHEDULER_METRICS_INTERVAL
         
         return changes
 
@@ -253,65 +352,43 @@ class SchedulerApp:
         
         self.logger.info("F5 client configuration updated")
 
+    async def _replace_task(self, name: str, coro_factory, description: str) -> bool:
+        """Cancel the named background task and start a fresh one in its place
+        
+        Returns:
+            False if no task with that name is running (scheduler not started)
+        """
+        old_task = self.tasks.get(name)
+        if old_task is None:
+            return False
+        
+        self.logger.debug(f"Canceling old {description} task")
+        old_task.cancel()
+        # Do not block the hot reload on the old task observing its cancellation; keep a
+        # reference until it finishes so the event loop's weak reference is not the only one
+        self._retiring_tasks.add(old_task)
+        old_task.add_done_callback(self._retiring_tasks.discard)
+        
+        self.tasks[name] = asyncio.create_task(coro_factory(), name=name)
+        return True
+
     async def _restart_pool_fetch_task(self, new_interval: int):
         """Restart Pool fetch task"""
-        # Only restart if task list exists and has enough elements
-        if self.tasks and len(self.tasks) > 1:
-            # Cancel old Pool fetch task (index 1)
-            old_task = self.tasks[1]  # pool_fetch_task is at index 1
-            self.logger.debug("Canceling old Pool fetch task")
-            old_task.cancel()
-            
-            try:
-                await old_task  # Wait for task to complete fully
-            except asyncio.CancelledError:
-                pass
-            
-            # Create new task
-            new_task = asyncio.create_task(self._pool_fetch_task())
-            self.tasks[1] = new_task
+        if await self._replace_task("pool_fetch", self._pool_fetch_task, "Pool fetch"):
             self.logger.info(f"Pool fetch task restarted, new interval: {new_interval} seconds")
         else:
             self.logger.info(f"Pool fetch task configuration updated, new interval: {new_interval} seconds (will take effect on next start)")
 
     async def _restart_metrics_collection_task(self, new_interval: int):
         """Restart Metrics collection task"""
-        # Only restart if task list exists and has enough elements
-        if self.tasks and len(self.tasks) > 2:
-            # Cancel old Metrics collection task (index 2)
-            old_task = self.tasks[2]  # metrics_collection_task is at index 2
-            self.logger.debug("Canceling old Metrics collection task")
-            old_task.cancel()
-            
-            try:
-                await old_task  # Wait for task to complete fully
-            except asyncio.CancelledError:
-                pass
-            
-            # Create new task
-            new_task = asyncio.create_task(self._metrics_collection_task())
-            self.tasks[2] = new_task
+        if await self._replace_task("metrics_collection", self._metrics_collection_task, "Metrics collection"):
             self.logger.info(f"Metrics collection task restarted, new interval: {new_interval/1000} seconds")
         else:
             self.logger.info(f"Metrics collection task configuration updated, new interval: {new_interval/1000} seconds (will take effect on next start)")
 
     async def _restart_api_key_sync_task(self):
         """Restart API key sync task"""
-        # Only restart if task list exists and has enough elements
-        if self.tasks and len(self.tasks) > 4:
-            # Cancel old API key sync task (index 4)
-            old_task = self.tasks[4]  # api_key_sync_task is at index 4
-            self.logger.debug("Canceling old API key sync task")
-            old_task.cancel()
-            
-            try:
-                await old_task  # Wait for task to complete fully
-            except asyncio.CancelledError:
-                pass
-            
-            # Create new task
-            new_task = asyncio.create_task(self._api_key_sync_task())
-            self.tasks[4] = new_task
+        if await self._replace_task("api_key_sync", self._api_key_sync_task, "API key sync"):
             self.logger.info("API key sync task restarted with updated configuration")
         else:
             self.logger.info("API key sync task configuration updated (will take effect on next start)")
@@ -319,81 +396,89 @@ class SchedulerApp:
     async def _update_pools_config(self, old_pools: List[PoolConfig], new_pools: List[PoolConfig]):
         """Smart update Pool configuration"""
         # Build mapping between old and new configurations
-        old_pool_map = {f"{p.name}:{p.partition}": p for p in old_pools}
-        new_pool_map = {f"{p.name}:{p.partition}": p for p in new_pools}
+        old_pool_map = {(p.name, p.partition): p for p in old_pools}
+        new_pool_map = {(p.name, p.partition): p for p in new_pools}
+        # Key views support set operations directly, without copying the keys into sets
+        old_keys = old_pool_map.keys()
+        new_keys = new_pool_map.keys()
         
         # 1. Handle removed Pools (explicitly deleted in configuration)
-        removed_pools = set(old_pool_map.keys()) - set(new_pool_map.keys())
+        removed_pools = old_keys - new_keys
         for pool_key in removed_pools:
             if pool_key in POOLS:
                 del POOLS[pool_key]
-                self.logger.info(f"Configuration deleted Pool: {pool_key}")
+                self.logger.info(f"Configuration deleted Pool: {format_pool_key(pool_key)}")
         
         # 2. Handle added Pools (automatically created on next fetch)
-        added_pools = set(new_pool_map.keys()) - set(old_pool_map.keys())
+        added_pools = new_keys - old_keys
         for pool_key in added_pools:
-            self.logger.info(f"Configuration added Pool: {pool_key}")
+            self.logger.info(f"Configuration added Pool: {format_pool_key(pool_key)}")
         
         # 3. Handle updated Pools (preserve member data and score)
-        updated_pools = set(old_pool_map.keys()) & set(new_pool_map.keys())
+        updated_pools = old_keys & new_keys
         for pool_key in updated_pools:
             old_pool_config = old_pool_map[pool_key]
             new_pool_config = new_pool_map[pool_key]
+            pool_label = format_pool_key(pool_key)
             
             # Check for substantive changes
             existing_pool = get_pool_by_key(new_pool_config.name, new_pool_config.partition)
             if existing_pool:
                 # Update engine_type if changed
                 if old_pool_config.engine_type != new_pool_config.engine_type:
-                    existing_pool.engine_type = EngineType(new_pool_config.engine_type)
+                    existing_pool.engine_type = new_pool_config.engine_type_enum
                     # Clear metrics key cache when engine_type changes
                     existing_pool.clear_all_members_key_cache()
-                    self.logger.info(f"Updated Pool {pool_key} engine_type: {new_pool_config.engine_type}, cleared member key cache")
+                    self.logger.info(f"Updated Pool {pool_label} engine_type: {new_pool_config.engine_type}, cleared member key cache")
                 
                 # Update fallback configuration if changed
                 if old_pool_config.fallback.pool_fallback != new_pool_config.fallback.pool_fallback:
                     existing_pool.pool_fallback = new_pool_config.fallback.pool_fallback
-                    self.logger.info(f"Updated Pool {pool_key} pool_fallback: {new_pool_config.fallback.pool_fallback}")
+                    self.logger.info(f"Updated Pool {pool_label} pool_fallback: {new_pool_config.fallback.pool_fallback}")
                 
                 if old_pool_config.fallback.member_running_req_threshold != new_pool_config.fallback.member_running_req_threshold:
                     existing_pool.member_running_req_threshold = new_pool_config.fallback.member_running_req_threshold
-                    self.logger.info(f"Updated Pool {pool_key} member_running_req_threshold: {new_pool_config.fallback.member_running_req_threshold}")
+                    self.logger.info(f"Updated Pool {pool_label} member_running_req_threshold: {new_pool_config.fallback.member_running_req_threshold}")
                 
                 if old_pool_config.fallback.member_waiting_queue_threshold != new_pool_config.fallback.member_waiting_queue_threshold:
                     existing_pool.member_waiting_queue_threshold = new_pool_config.fallback.member_waiting_queue_threshold
-                    self.logger.info(f"Updated Pool {pool_key} member_waiting_queue_threshold: {new_pool_config.fallback.member_waiting_queue_threshold}")
+                    self.logger.info(f"Updated Pool {pool_label} member_waiting_queue_threshold: {new_pool_config.fallback.member_waiting_queue_threshold}")
             
             # metrics configuration changes will be automatically applied on next collection
             if old_pool_config.metrics != new_pool_config.metrics:
-                self.logger.info(f"Updated Pool {pool_key} metrics configuration")
+                self.logger.info(f"Updated Pool {pool_label} metrics configuration")
             
             # model_APIkey configuration changes - update existing pool and restart sync task if needed
             if old_pool_config.model_APIkey != new_pool_config.model_APIkey:
                 if existing_pool:
                     existing_pool.model_APIkey = new_pool_config.model_APIkey
-                    self.logger.info(f"Updated Pool {pool_key} model_APIkey configuration")
+                    self.logger.info(f"Updated Pool {pool_label} model_APIkey configuration")
                 
                 # If this is a XInference pool with API key config, restart sync task
-                if (new_pool_config.engine_type.lower() == 'xinference' and 
+                if (new_pool_config.engine_type_enum == EngineType.XINFERENCE and 
                     new_pool_config.model_APIkey is not None):
                     self._restart_api_key_sync_needed = True
         
         # 4. Clean up memory of Pools that exist in memory but not in configuration (avoid conflicts with fetch failure cleanup)
         # This handles configuration-level deletion, unlike fetch failure-driven cleanup
-        configured_pool_keys = set(new_pool_map.keys())
-        memory_pool_keys = set(POOLS.keys())
-        orphaned_pools = memory_pool_keys - configured_pool_keys
+        orphaned_pools = POOLS.keys() - new_keys
         
         for orphaned_key in orphaned_pools:
             # Check if this is the most recent fetch failed Pool (avoid repeated processing)
             existing_pool = POOLS.get(orphaned_key)
-            if existing_pool and hasattr(existing_pool, '_consecutive_failures'):
-                if existing_pool._consecutive_failures > 0:
-                    # This Pool has already been processed in fetch failure flow, skip
-                    continue
+            if existing_pool and existing_pool._consecutive_failures > 0:
+                # This Pool has already been processed in fetch failure flow, skip
+                continue
             
-            self.logger.info(f"Configuration cleanup: Deleting orphaned Pool from memory: {orphaned_key}")
+            self.logger.info(f"Configuration cleanup: Deleting orphaned Pool from memory: {format_pool_key(orphaned_key)}")
             del POOLS[orphaned_key]
+        
+        self._release_removed_pools_state()
+    
+    def _release_removed_pools_state(self):
+        """Drop score calculation state kept for Pools that are no longer in memory"""
+        if self.score_calculator:
+            self.score_calculator.prune_pools(POOLS.keys())
 
     def _update_modes_config(self, new_modes):
         """Update algorithm mode configuration"""
@@ -408,7 +493,7 @@ class SchedulerApp:
         old_config = self.config
         changes = self._analyze_config_changes(old_config, new_config)
         
-        changed_items = [k for k, v in changes.items() if v]
+        changed_items = [flag.name.lower() for flag in ConfigChange if changes & flag]
         self.logger.info(f"Starting to apply configuration changes: {changed_items}")
         
         # Initialize API key sync restart flag
@@ -416,30 +501,30 @@ class SchedulerApp:
         
         try:
             # 1. Logger system hot update
-            if changes.get('global_log', False):
+            if changes & ConfigChange.GLOBAL_LOG:
                 await self._update_logger_config(new_config.global_config)
                 
             # 2. F5 client hot update
-            if changes.get('f5', False):
+            if changes & ConfigChange.F5:
                 await self._update_f5_config(new_config.f5)
                 
             # 3. Background task hot update
-            if changes.get('scheduler_pool_interval', False):
+            if changes & ConfigChange.SCHEDULER_POOL_INTERVAL:
                 await self._restart_pool_fetch_task(new_config.scheduler.pool_fetch_interval)
                 
-            if changes.get('scheduler_metrics_interval', False):
+            if changes & ConfigChange.SCHEDULER_METRICS_INTERVAL:
                 await self._restart_metrics_collection_task(new_config.scheduler.metrics_fetch_interval)
                 
             # 4. Smart Pool configuration update
-            if changes.get('pools', False):
+            if changes & ConfigChange.POOLS:
                 await self._update_pools_config(old_config.pools, new_config.pools)
                 
             # 5. Algorithm mode update
-            if changes.get('modes', False):
+            if changes & ConfigChange.MODES:
                 self._update_modes_config(new_config.modes)
             
             # 6. Engine metrics keys update
-            if changes.get('engine_metrics_keys', False):
+            if changes & ConfigChange.ENGINE_METRICS_KEYS:
                 self.logger.info("Detected engines_metrics_keys configuration change, refreshing candidates...")
                 refresh_engine_metrics_candidates(new_config.engine_metrics_keys)
                 
@@ -454,12 +539,12 @@ class SchedulerApp:
                 self.logger.info("Cleared all member metrics key cache, will re-detect on next collection")
                 
             # 8. API port change reminder
-            if changes.get('global_api_port', False):
+            if changes & ConfigChange.GLOBAL_API_PORT:
                 self.logger.warning(f"API port changed from {old_config.global_config.api_port} "
                                   f"to {new_config.global_config.api_port}, need to restart program to take effect")
             
             # API address change reminder
-            if changes.get('global_api_host', False):
+            if changes & ConfigChange.GLOBAL_API_HOST:
                 self.logger.warning(f"API listening address changed from {old_config.global_config.api_host} "
                                   f"to {new_config.global_config.api_host}, need to restart program to take effect")
             
@@ -472,7 +557,7 @@ class SchedulerApp:
             self.logger.info("Hot configuration update completed")
             
             # Return whether to adjust monitoring interval
-            return changes.get('global_interval', False)
+            return bool(changes & ConfigChange.GLOBAL_INTERVAL)
             
         except Exception as e:
             self.logger.error(f"Hot configuration update failed, keeping original configuration: {e}")
@@ -485,19 +570,20 @@ class SchedulerApp:
         self.running = True
         
         # Start background tasks (excluding independent scheduled tasks for Score calculation)
-        self.tasks = [
-            asyncio.create_task(self._config_monitor_task()),
-            asyncio.create_task(self._pool_fetch_task()),
-            asyncio.create_task(self._metrics_collection_task()),
-            asyncio.create_task(self._api_server_task()),
-            asyncio.create_task(self._api_key_sync_task())
-        ]
+        task_factories = {
+            "config_monitor": self._config_monitor_task,
+            "pool_fetch": self._pool_fetch_task,
+            "metrics_collection": self._metrics_collection_task,
+            "api_server": self._api_server_task,
+            "api_key_sync": self._api_key_sync_task,
+        }
+        self.tasks = {name: asyncio.create_task(factory(), name=name) for name, factory in task_factories.items()}
         
         self.logger.info("Scheduler started, all background tasks are running...")
         
         # Wait for all tasks to complete
         try:
-            await asyncio.gather(*self.tasks)
+            await asyncio.gather(*self.tasks.values())
         except asyncio.CancelledError:
             self.logger.info("Scheduler tasks cancelled")
     
@@ -507,12 +593,12 @@ class SchedulerApp:
         self.running = False
         
         # Cancel all tasks
-        for task in self.tasks:
+        for task in self.tasks.values():
             if not task.done():
                 task.cancel()
         
         # Wait for task cleanup
-        await asyncio.gather(*self.tasks, return_exceptions=True)
+        await asyncio.gather(*self.tasks.values(), *self._retiring_tasks, return_exceptions=True)
         
         # Close connections
         if self.f5_client:
@@ -571,9 +657,13 @@ class SchedulerApp:
         """Pool member fetch task"""
         self.logger.debug(f"Pool fetch task started, interval: {self.config.scheduler.pool_fetch_interval}s")
         
+        # Fixed-rate schedule: sleep until the next deadline so the run time does not stretch the interval
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.scheduler.pool_fetch_interval
+        
         while self.running:
             try:
-                await asyncio.sleep(self.config.scheduler.pool_fetch_interval)
+                await asyncio.sleep(max(0.0, deadline - loop.time()))
                 
                 if not self.running:
                     break
@@ -581,11 +671,18 @@ class SchedulerApp:
                 self.logger.debug("Starting to fetch Pool member information...")
                 await self._fetch_all_pools()
                 
+                deadline, skipped = _advance_deadline(
+                    deadline, self.config.scheduler.pool_fetch_interval, loop.time()
+                )
+                if skipped:
+                    self.logger.debug(f"Pool fetch overran its interval, skipped {skipped} tick(s)")
+                
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self.logger.error(f"Pool fetch task exception: {e}")
                 await asyncio.sleep(30)  # Wait 30 seconds on error
+                deadline = loop.time() + self.config.scheduler.pool_fetch_interval
     
     async def _score_calculation_task(self):
         """Score calculation task (single execution)"""
@@ -599,9 +696,13 @@ class SchedulerApp:
         interval_seconds = self.config.scheduler.metrics_fetch_interval / 1000.0
         self.logger.debug(f"Metrics collection task started, interval: {interval_seconds}s")
         
+        # Fixed-rate schedule: sleep until the next deadline so the run time does not stretch the interval
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + interval_seconds
+        
         while self.running:
             try:
-                await asyncio.sleep(interval_seconds)
+                await asyncio.sleep(max(0.0, deadline - loop.time()))
 
                 if not self.running:
                     break
@@ -611,12 +712,17 @@ class SchedulerApp:
                 
                 # Note: Each Pool now triggers score calculation immediately after its metrics collection
                 # No need for unified score calculation call here
+                
+                deadline, skipped = _advance_deadline(deadline, interval_seconds, loop.time())
+                if skipped:
+                    self.logger.debug(f"Metrics collection overran its interval, skipped {skipped} tick(s)")
                     
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self.logger.error(f"Metrics collection task exception: {e}")
                 await asyncio.sleep(10)  # Wait 10 seconds on error
+                deadline = loop.time() + interval_seconds
     
     async def _api_server_task(self):
         """API server task"""
@@ -635,7 +741,7 @@ class SchedulerApp:
         sync_tasks = []
         
         for pool_config in self.config.pools:
-            if (pool_config.engine_type.lower() == 'xinference' and 
+            if (pool_config.engine_type_enum == EngineType.XINFERENCE and 
                 pool_config.model_APIkey is not None):
                 
                 self.logger.debug(f"Found XInference pool config: {pool_config.name} with API key config")
@@ -751,16 +857,42 @@ class SchedulerApp:
         # Ensure shared F5 session is available; do NOT use context manager here to avoid closing it
         await self.f5_client._ensure_session()
         
-        for pool_config in self.config.pools:
-            pool_key = f"{pool_config.name}:{pool_config.partition}"
-            try:
-                # Get latest member list from F5
-                new_members = await self.f5_client.get_pool_members(
+        # Fetch all Pools' members concurrently (bounded), then apply results in config order
+        semaphore = asyncio.Semaphore(POOL_FETCH_CONCURRENCY)
+        
+        async def fetch_members(pool_config: PoolConfig) -> List[PoolMember]:
+            async with semaphore:
+                return await self.f5_client.get_pool_members(
                     pool_config.name,
                     pool_config.partition
                 )
-                
-                engine_type = EngineType(pool_config.engine_type)
+        
+        pool_configs = list(self.config.pools)
+        results = await asyncio.gather(
+            *(fetch_members(pool_config) for pool_config in pool_configs),
+            return_exceptions=True
+        )
+        
+        # A hot reload may have replaced the configuration while fetching; apply results
+        # against the current configuration so a Pool removed meanwhile is not re-added
+        current_pool_configs = {(p.name, p.partition): p for p in self.config.pools}
+        # Non-Exception BaseExceptions (e.g. cancellation) are raised after all other results are applied
+        deferred_error: Optional[BaseException] = None
+        
+        for fetched_config, result in zip(pool_configs, results):
+            pool_key = (fetched_config.name, fetched_config.partition)
+            pool_config = current_pool_configs.get(pool_key)
+            if pool_config is None:
+                self.logger.info(f"Pool {format_pool_key(pool_key)} was removed from configuration during fetch, discarding result")
+                continue
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                deferred_error = deferred_error or result
+                continue
+            try:
+                # Re-raise fetch failure so it goes through the same failure analysis
+                if isinstance(result, Exception):
+                    raise result
+                new_members = result
                 
                 # Check if Pool already exists
                 existing_pool = get_pool_by_key(pool_config.name, pool_config.partition)
@@ -768,8 +900,9 @@ class SchedulerApp:
                 if existing_pool:
                     # Pool exists, smartly update member list (preserve score values)
                     # Record member information before update for comparison
-                    old_member_keys = set(f"{m.ip}:{m.port}" for m in existing_pool.members)
-                    new_member_keys = set(f"{m.ip}:{m.port}" for m in new_members)
+                    # (ip, port) tuples avoid formatting a string per member; only the diffs are formatted for logging
+                    old_member_keys = {(m.ip, m.port) for m in existing_pool.members}
+                    new_member_keys = {(m.ip, m.port) for m in new_members}
                     
                     update_stats = existing_pool.update_members_smartly(new_members)
                     
@@ -784,12 +917,12 @@ class SchedulerApp:
                     # Record newly added members
                     added_members = new_member_keys - old_member_keys
                     if added_members:
-                        self.logger.info(f"Added members: {list(added_members)}")
+                        self.logger.info(f"Added members: {[f'{ip}:{port}' for ip, port in added_members]}")
                     
                     # Record removed members
                     removed_members = old_member_keys - new_member_keys
                     if removed_members:
-                        self.logger.info(f"Removed members: {list(removed_members)}")
+                        self.logger.info(f"Removed members: {[f'{ip}:{port}' for ip, port in removed_members]}")
                     
                     # Reset consecutive failure count
                     existing_pool._consecutive_failures = 0
@@ -798,7 +931,7 @@ class SchedulerApp:
                     pool = Pool(
                         name=pool_config.name,
                         partition=pool_config.partition,
-                        engine_type=engine_type,
+                        engine_type=pool_config.engine_type_enum,
                         members=new_members,
                         pool_fallback=pool_config.fallback.pool_fallback,
                         member_running_req_threshold=pool_config.fallback.member_running_req_threshold,
@@ -806,7 +939,7 @@ class SchedulerApp:
                     )
                     
                     # Set model_APIkey configuration for XInference pools
-                    if pool_config.engine_type.lower() == 'xinference' and pool_config.model_APIkey:
+                    if pool_config.engine_type_enum == EngineType.XINFERENCE and pool_config.model_APIkey:
                         pool.model_APIkey = pool_config.model_APIkey
                     
                     # Add to memory
@@ -827,24 +960,25 @@ class SchedulerApp:
                 if should_count_failure:
                     existing_pool = get_pool_by_key(pool_config.name, pool_config.partition)
                     if existing_pool:
-                        # Increase consecutive failure count
-                        if not hasattr(existing_pool, '_consecutive_failures'):
-                            existing_pool._consecutive_failures = 0
+                        # Increase consecutive failure count (always initialized by Pool)
                         existing_pool._consecutive_failures += 1
                         
                         self.logger.warning(
-                            f"Pool {pool_key} consecutive serious failures {existing_pool._consecutive_failures} times (type: {failure_type})"
+                            f"Pool {format_pool_key(pool_key)} consecutive serious failures {existing_pool._consecutive_failures} times (type: {failure_type})"
                         )
                         
                         # If consecutive failures exceed threshold, remove from memory
-                        failure_threshold = 5
-                        if existing_pool._consecutive_failures >= failure_threshold:
+                        if existing_pool._consecutive_failures >= POOL_FAILURE_THRESHOLD:
                             self.logger.warning(
-                                f"Pool {pool_key} consecutive serious failures {failure_threshold} times, may have been deleted, cleaning from memory"
+                                f"Pool {format_pool_key(pool_key)} consecutive serious failures {POOL_FAILURE_THRESHOLD} times, may have been deleted, cleaning from memory"
                             )
                             del POOLS[pool_key]
+                            self._release_removed_pools_state()
                 else:
-                    self.logger.info(f"Pool {pool_key} encountered temporary issues, not counting as failure")
+                    self.logger.info(f"Pool {format_pool_key(pool_key)} encountered temporary issues, not counting as failure")
+        
+        if deferred_error is not None:
+            raise deferred_error
         
         # Note: Removed configuration consistency cleanup to avoid conflicts with hot reload
         # Configuration consistency cleanup is handled in hot reload's _update_pools_config
@@ -896,14 +1030,12 @@ class SchedulerApp:
             # Create async tasks for each Pool
             tasks = []
             pool_names = []  # For logging
+            # Index configurations once per round, matching POOLS keys, instead of scanning per Pool
+            pool_configs = {(config.name, config.partition): config for config in self.config.pools}
             
             for pool in pools:
                 # Find corresponding configuration
-                pool_config = None
-                for config in self.config.pools:
-                    if config.name == pool.name and config.partition == pool.partition:
-                        pool_config = config
-                        break
+                pool_config = pool_configs.get(pool.get_pool_key())
                 
                 if not pool_config:
                     self.logger.warning(f"Configuration not found for Pool {pool.name}")
@@ -1032,9 +1164,26 @@ async def main():
         _scheduler_app_instance = None  # 清理全局实例
 
 
+def _run_event_loop(coro):
+    """Run the coroutine on uvloop when it is installed, otherwise on the default asyncio loop
+    
+    uvloop is pulled in by uvicorn[standard] on Linux.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            return runner.run(coro)
+    uvloop.install()
+    return asyncio.run(coro)
+
+
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        _run_event_loop(main())
     except KeyboardInterrupt:
         print("\nProgram interrupted")
     except Exception as e:
@@ -1,5 +1,6 @@
-import requests
-import time
+import asyncio
+import json
+import aiohttp
 from collections import Counter, defaultdict
 
 SELECT_URL = "http://localhost:8080/scheduler/select"
@@ -17,47 +18,55 @@ POOL_REQUEST_PAYLOAD = {
     "members": ["127.0.0.1:8001", "127.0.0.1:8002", "127.0.0.1:8003"]
 }
 MEMBERS = POOL_REQUEST_PAYLOAD["members"]
+# The select payload never changes, so serialize it once instead of per request
+POOL_REQUEST_BODY = json.dumps(POOL_REQUEST_PAYLOAD).encode()
 
 # Data structures for overall statistics
 history_selection = defaultdict(list)  # Selection probability for each member per round
 history_percent = defaultdict(list)    # Status percent for each member per round
 
-def run_scheduler_test(num_requests=1000):
+async def run_scheduler_test(session, num_requests=1000, max_concurrency=100):
+    timeout = aiohttp.ClientTimeout(total=3)
+    # Cap in-flight requests at the connection pool size so excess requests queue here
+    # instead of failing with connection errors that would count as failed selections
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def post_once():
+        async with semaphore:
+            async with session.post(SELECT_URL, headers=HEADERS, data=POOL_REQUEST_BODY, timeout=timeout) as response:
+                if response.status != 200:
+                    return None
+                # New plain text response format
+                return (await response.text()).strip()
+
+    # Send all requests concurrently instead of one round trip after another
+    results = await asyncio.gather(*[post_once() for _ in range(num_requests)], return_exceptions=True)
+
     counter = Counter()
     success = 0
     fail = 0
-
-    for _ in range(num_requests):
-        try:
-            response = requests.post(SELECT_URL, headers=HEADERS, json=POOL_REQUEST_PAYLOAD, timeout=3)
-            if response.status_code == 200:
-                # New plain text response format
-                selected = response.text.strip()
-                if selected in MEMBERS:
-                    counter[selected] += 1
-                    success += 1
-                else:
-                    fail += 1
-            else:
-                fail += 1
-        except Exception:
+    for selected in results:
+        if isinstance(selected, str) and selected in MEMBERS:
+            counter[selected] += 1
+            success += 1
+        else:
             fail += 1
 
     return counter, success, fail
 
-def get_status_percent():
+async def get_status_percent(session):
     try:
-        response = requests.get(STATUS_URL, timeout=3)
-        if response.status_code == 200:
-            data = response.json()
-            for pool in data.get("pools", []):
-                if pool.get("name") == "example_pool1":
-                    member_percents = {}
-                    for m in pool.get("members", []):
-                        addr = f"{m['ip']}:{m['port']}"
-                        percent = m.get("percent", 0.0)
-                        member_percents[addr] = percent
-                    return member_percents
+        async with session.get(STATUS_URL, timeout=aiohttp.ClientTimeout(total=3)) as response:
+            if response.status == 200:
+                data = await response.json(content_type=None)
+                for pool in data.get("pools", []):
+                    if pool.get("name") == "example_pool1":
+                        member_percents = {}
+                        for m in pool.get("members", []):
+                            addr = f"{m['ip']}:{m['port']}"
+                            percent = m.get("percent", 0.0)
+                            member_percents[addr] = percent
+                        return member_percents
     except Exception:
         pass
     return {}
@@ -76,27 +85,31 @@ def print_round_report(counter, success, fail, percent_from_status, total):
         print(f"{member},{picked_percent:.2f}%,{status_percent:.2f}%")
     print("--------------------------------------------")
 
-def trigger_metrics_update():
-    all_success = True
-    for url in TRIGGER_URLS:
+async def trigger_metrics_update(session):
+    timeout = aiohttp.ClientTimeout(total=3)
+
+    async def trigger_one(url):
         try:
-            response = requests.post(url, timeout=3)
-            if response.status_code != 200:
-                all_success = False
-                print(f"[Error] Request {url} returned status code: {response.status_code}")
-                try:
-                    print("Response content:", response.json())
-                except Exception:
-                    print("Response content is not JSON format:", response.text)
-            else:
-                json_data = response.json()
+            async with session.post(url, timeout=timeout) as response:
+                if response.status != 200:
+                    print(f"[Error] Request {url} returned status code: {response.status}")
+                    try:
+                        print("Response content:", await response.json(content_type=None))
+                    except Exception:
+                        print("Response content is not JSON format:", await response.text())
+                    return False
+                json_data = await response.json(content_type=None)
                 if json_data.get("status") != "Metrics updated immediately":
-                    all_success = False
                     print(f"[Error] Request {url} response content abnormal: {json_data}")
+                    return False
+                return True
         except Exception as e:
-            all_success = False
             print(f"[Error] Request {url} failed, exception: {e}")
-    return all_success
+            return False
+
+    # Trigger all agents at once so one slow agent costs one timeout, not one per URL
+    results = await asyncio.gather(*[trigger_one(url) for url in TRIGGER_URLS])
+    return all(results)
 
 
 def print_final_summary():
@@ -142,37 +155,40 @@ def draw_visual_charts():
     print("Charts generated, files saved in current directory.")
 
 
-def main():
+async def main():
     try:
         loop_times = int(input("Enter the number of loops: "))
     except ValueError:
         print("Please enter a valid number")
         return
 
-    for i in range(loop_times):
-        print(f"\n=== Round {i+1} test begins ===")
-        counter, success, fail = run_scheduler_test()
-        status_percent = get_status_percent()
-
-        # Record current round data
-        total = 1000
-        for member in MEMBERS:
-            picked_percent = (counter[member] / total) * 100 if total else 0
-            status_val = status_percent.get(member, 0.0)
-            history_selection[member].append(picked_percent)
-            history_percent[member].append(status_val)
-
-        # Display current round test report
-        print_round_report(counter, success, fail, status_percent, total)
-
-        print("Pausing 1 second, preparing to trigger metrics update...")
-        time.sleep(1)
-
-        if trigger_metrics_update():
-            print("All metrics update requests executed successfully. Delaying 2 second for make sure metrics are fetched and updated.")
-            time.sleep(2)
-        else:
-            print("Some metrics update requests failed, please check service status.")
+    # One session for every request in all rounds, so connections are kept alive and reused
+    connector = aiohttp.TCPConnector(limit=128, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        for i in range(loop_times):
+            print(f"\n=== Round {i+1} test begins ===")
+            counter, success, fail = await run_scheduler_test(session)
+            status_percent = await get_status_percent(session)
+
+            # Record current round data
+            total = 1000
+            for member in MEMBERS:
+                picked_percent = (counter[member] / total) * 100 if total else 0
+                status_val = status_percent.get(member, 0.0)
+                history_selection[member].append(picked_percent)
+                history_percent[member].append(status_val)
+
+            # Display current round test report
+            print_round_report(counter, success, fail, status_percent, total)
+
+            print("Pausing 1 second, preparing to trigger metrics update...")
+            await asyncio.sleep(1)
+
+            if await trigger_metrics_update(session):
+                print("All metrics update requests executed successfully. Delaying 2 second for make sure metrics are fetched and updated.")
+                await asyncio.sleep(2)
+            else:
+                print("Some metrics update requests failed, please check service status.")
 
     # Output summary table after all rounds completed
     print_final_summary()
@@ -181,4 +197,4 @@ def main():
     draw_visual_charts()
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -0,0 +1,325 @@
+"""
+Scheduler application tests: pool fetching against a fake F5 client
+"""
+
+import copy
+import os
+import sys
+import asyncio
+import tempfile
+from pathlib import Path
+
+# Add project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import main
+from main import SchedulerApp, ConfigHotReloader, ConfigChange
+from core.models import PoolMember, EngineType, POOLS
+from config.config_loader import AppConfig, PoolConfig, F5Config
+from utils.exceptions import F5ApiError
+from utils.logger import get_logger
+
+
+def _pool_config(name: str) -> PoolConfig:
+    return PoolConfig(name=name, engine_type="vllm", engine_type_enum=EngineType.VLLM)
+
+
+class _FakeF5Client:
+    """Returns one member per pool; pool names listed in errors raise the given exception"""
+
+    def __init__(self, errors=None, on_fetch=None):
+        self.errors = errors or {}
+        self.on_fetch = on_fetch
+
+    async def _ensure_session(self):
+        pass
+
+    async def get_pool_members(self, pool_name, partition):
+        await asyncio.sleep(0)
+        if self.on_fetch:
+            self.on_fetch(pool_name)
+        if pool_name in self.errors:
+            raise self.errors[pool_name]
+        return [PoolMember("10.0.0.1", 8001, partition)]
+
+
+def _make_app(pool_names, f5_client) -> SchedulerApp:
+    app = SchedulerApp()
+    app.logger = get_logger()
+    app.config = AppConfig(pools=[_pool_config(name) for name in pool_names])
+    app.f5_client = f5_client
+    return app
+
+
+def test_fetch_applies_results_after_cancelled_pool():
+    """A cancelled fetch of one Pool does not stop the others from being applied; cancellation is re-raised afterwards"""
+    print("Testing pool fetch with a cancelled member request...")
+    POOLS.clear()
+    try:
+        client = _FakeF5Client(errors={
+            "pool-b": asyncio.CancelledError(),
+            "pool-c": F5ApiError("Failed to get Pool members: HTTP 500"),
+        })
+        app = _make_app(["pool-a", "pool-b", "pool-c", "pool-d"], client)
+
+        try:
+            asyncio.run(app._fetch_all_pools())
+        except asyncio.CancelledError:
+            pass
+        else:
+            raise AssertionError("Cancellation of a pool fetch should be re-raised")
+
+        assert set(POOLS) == {("pool-a", "Common"), ("pool-d", "Common")}
+    finally:
+        POOLS.clear()
+
+    print("✓ Cancelled pool fetch test passed")
+
+
+def test_fetch_skips_pool_removed_during_fetch():
+    """A Pool removed from configuration while its members were being fetched is not re-added"""
+    print("\nTesting pool removed by hot reload during fetch...")
+    POOLS.clear()
+    try:
+        app = None
+
+        def reload_without_pool_b(pool_name):
+            app.config = AppConfig(pools=[_pool_config("pool-a")])
+
+        app = _make_app(["pool-a", "pool-b"], _FakeF5Client(on_fetch=reload_without_pool_b))
+        asyncio.run(app._fetch_all_pools())
+
+        assert set(POOLS) == {("pool-a", "Common")}
+    finally:
+        POOLS.clear()
+
+    print("✓ Removed pool fetch test passed")
+
+
+def _write(path: str, text: str) -> None:
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def test_digest_if_unchanged_skips_rewritten_file():
+    """A file rewritten between the stat and the digest is not hashed"""
+    print("\nTesting digest of a file rewritten after stat...")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "scheduler-config.yaml")
+        _write(path, "global:\n  interval: 60\n")
+        mtime_ns, size = main._stat_config_file(path)
+        assert main._digest_if_unchanged(path, mtime_ns, size) == main._config_file_digest(path)
+
+        _write(path, "global:\n  interval: 30\n  log_level: DEBUG\n")
+        assert main._digest_if_unchanged(path, mtime_ns, size) is None
+
+    print("✓ Rewritten file digest test passed")
+
+
+def test_hot_reloader_waits_for_write_to_settle():
+    """A file still being written during the settle window is not reported; the next poll picks up the final content"""
+    print("\nTesting hot reload settle window...")
+    original_settle = main.CONFIG_CHANGE_SETTLE_SECONDS
+    main.CONFIG_CHANGE_SETTLE_SECONDS = 0.05
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "scheduler-config.yaml")
+            _write(path, "global:\n  interval: 60\n")
+
+            async def run():
+                reloader = ConfigHotReloader(path)
+                assert await reloader.detect_changes() is False  # Baseline
+                baseline_hash = reloader.last_hash
+
+                async def finish_write():
+                    await asyncio.sleep(0.01)
+                    _write(path, "global:\n  interval: 30\n  log_level: DEBUG\n")
+
+                # First half of the write, then the rest lands inside the settle window
+                _write(path, "global:\n  interval: 30\n")
+                writer = asyncio.create_task(finish_write())
+                assert await reloader.detect_changes() is False, "Partially written file must not be reported"
+                await writer
+                assert reloader.last_hash == baseline_hash
+
+                assert await reloader.detect_changes() is True
+                assert reloader.last_hash == main._config_file_digest(path)
+
+            asyncio.run(run())
+    finally:
+        main.CONFIG_CHANGE_SETTLE_SECONDS = original_settle
+
+    print("✓ Hot reload settle window test passed")
+
+
+def test_hot_reloader_unchanged_stat_skips_hashing():
+    """Polling a file whose mtime and size are unchanged never reads or hashes it"""
+    print("\nTesting hot reload polling of an unchanged file...")
+    original_digest = main._config_file_digest
+    digest_calls = []
+
+    def counting_digest(config_file):
+        digest_calls.append(config_file)
+        return original_digest(config_file)
+
+    main._config_file_digest = counting_digest
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "scheduler-config.yaml")
+            _write(path, "global:\n  interval: 60\n")
+
+            async def run():
+                reloader = ConfigHotReloader(path)
+                await reloader.detect_changes()  # Baseline hashes once
+                digest_calls.clear()
+                for _ in range(3):
+                    assert await reloader.detect_changes() is False
+
+            asyncio.run(run())
+        assert digest_calls == []
+    finally:
+        main._config_file_digest = original_digest
+
+    print("✓ Unchanged file polling test passed")
+
+
+def test_advance_deadline():
+    """Fixed-rate schedule: on-time runs keep cadence, overruns skip to the next aligned tick"""
+    print("\nTesting fixed-rate deadline advance...")
+
+    # Run finished before the next deadline: plain advance, nothing skipped
+    assert main._advance_deadline(10.0, 1.0, 10.4) == (11.0, 0)
+    # Finishing exactly at the next deadline still runs that tick
+    assert main._advance_deadline(10.0, 1.0, 11.0) == (11.0, 0)
+    # Late by one interval: tick 11 is skipped, next run at 12
+    assert main._advance_deadline(10.0, 1.0, 11.5) == (12.0, 1)
+    # Late by many intervals: all missed ticks skipped, still aligned to the original grid
+    assert main._advance_deadline(10.0, 1.0, 14.2) == (15.0, 4)
+    assert main._advance_deadline(0.0, 0.25, 2.1) == (2.25, 8)
+
+    print("✓ Fixed-rate deadline advance test passed")
+
+
+def _reload_config() -> AppConfig:
+    return AppConfig(f5=F5Config(host="10.0.0.100"), pools=[_pool_config("pool-a")])
+
+
+def test_analyze_config_changes_flags():
+    """Each configuration difference maps to its section flag plus the matching detail flag"""
+    print("\nTesting configuration diff flags...")
+    app = SchedulerApp()
+    old = _reload_config()
+
+    assert app._analyze_config_changes(old, copy.deepcopy(old)) == ConfigChange(0)
+
+    new = copy.deepcopy(old)
+    new.global_config.log_level = "DEBUG"
+    new.global_config.interval = 30
+    assert app._analyze_config_changes(old, new) == (
+        ConfigChange.GLOBAL | ConfigChange.GLOBAL_LOG | ConfigChange.GLOBAL_INTERVAL
+    )
+
+    new = copy.deepcopy(old)
+    new.global_config.api_port = 9090
+    new.global_config.api_host = "127.0.0.1"
+    assert app._analyze_config_changes(old, new) == (
+        ConfigChange.GLOBAL | ConfigChange.GLOBAL_API_PORT | ConfigChange.GLOBAL_API_HOST
+    )
+
+    new = copy.deepcopy(old)
+    new.scheduler.pool_fetch_interval = 5
+    assert app._analyze_config_changes(old, new) == ConfigChange.SCHEDULER | ConfigChange.SCHEDULER_POOL_INTERVAL
+
+    new = copy.deepcopy(old)
+    new.scheduler.metrics_fetch_interval = 500
+    new.f5.password = "changed"
+    new.pools.append(_pool_config("pool-b"))
+    assert app._analyze_config_changes(old, new) == (
+        ConfigChange.SCHEDULER | ConfigChange.SCHEDULER_METRICS_INTERVAL | ConfigChange.F5 | ConfigChange.POOLS
+    )
+
+    # engine_type_enum is derived data and does not count as a change on its own
+    new = copy.deepcopy(old)
+    new.pools[0].engine_type_enum = None
+    assert app._analyze_config_changes(old, new) == ConfigChange(0)
+
+    print("✓ Configuration diff flags test passed")
+
+
+def test_apply_config_changes_dispatch():
+    """apply_config_changes runs exactly the updates selected by the change flags"""
+    print("\nTesting configuration change dispatch...")
+
+    def make_recording_app():
+        app = SchedulerApp()
+        app.logger = get_logger()
+        app.config = _reload_config()
+        calls = []
+
+        def recorder(name):
+            async def record(*args):
+                calls.append(name)
+            return record
+
+        app._update_logger_config = recorder("logger")
+        app._update_f5_config = recorder("f5")
+        app._restart_pool_fetch_task = recorder("pool_fetch")
+        app._restart_metrics_collection_task = recorder("metrics_collection")
+        app._update_pools_config = recorder("pools")
+        app._restart_api_key_sync_task = recorder("api_key_sync")
+        app._update_modes_config = lambda modes: calls.append("modes")
+        return app, calls
+
+    def mutate_log(config):
+        config.global_config.log_level = "DEBUG"
+
+    def mutate_intervals(config):
+        config.scheduler.pool_fetch_interval = 5
+        config.scheduler.metrics_fetch_interval = 500
+
+    def mutate_metrics_interval(config):
+        config.scheduler.metrics_fetch_interval = 500
+
+    def mutate_f5_and_pools(config):
+        config.f5.port = 8443
+        config.pools.append(_pool_config("pool-b"))
+
+    def mutate_monitor_interval(config):
+        config.global_config.interval = 30
+
+    def mutate_modes(config):
+        config.modes[0].w_a = 0.9
+
+    cases = [
+        (mutate_log, ["logger"], False),
+        (mutate_intervals, ["pool_fetch", "metrics_collection"], False),
+        (mutate_metrics_interval, ["metrics_collection"], False),
+        (mutate_f5_and_pools, ["f5", "pools"], False),
+        (mutate_monitor_interval, [], True),
+        (mutate_modes, ["modes"], False),
+    ]
+    for mutate, expected_calls, expected_interval_changed in cases:
+        app, calls = make_recording_app()
+        new_config = copy.deepcopy(app.config)
+        mutate(new_config)
+
+        interval_changed = asyncio.run(app.apply_config_changes(new_config))
+
+        assert calls == expected_calls, f"{mutate.__name__}: expected {expected_calls}, got {calls}"
+        assert interval_changed is expected_interval_changed, mutate.__name__
+        assert app.config is new_config
+
+    print("✓ Configuration change dispatch test passed")
+
+
+if __name__ == "__main__":
+    test_fetch_applies_results_after_cancelled_pool()
+    test_fetch_skips_pool_removed_during_fetch()
+    test_digest_if_unchanged_skips_rewritten_file()
+    test_hot_reloader_waits_for_write_to_settle()
+    test_hot_reloader_unchanged_stat_skips_hashing()
+    test_advance_deadline()
+    test_analyze_config_changes_flags()
+    test_apply_config_changes_dispatch()
+    print("\n✅ All scheduler application tests passed successfully!")
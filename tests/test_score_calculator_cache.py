@@ -0,0 +1,312 @@
+"""
+Score calculator internals tests: kernel result types and scoring caches
+"""
+
+import logging
+import math
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
+
+# Add project root directory to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.models import Pool, PoolMember, EngineType
+from core.score_calculator import ScoreCalculator, _s1_score_kernel, _s2_score_kernel
+from config.config_loader import ModeConfig
+from utils.logger import get_logger, LogLevel
+
+
+def test_score_kernels_return_arrays_for_all_pool_sizes():
+    """Small pools (scalar path) and larger pools (vectorized path) both return float64 arrays"""
+    print("Testing score kernel result types...")
+
+    for n in (1, 2, 3, 8):
+        waiting = np.linspace(0.0, 1.0, n)
+        cache = np.linspace(0.2, 0.6, n)
+        running = np.linspace(1.0, 0.0, n)
+
+        s1 = _s1_score_kernel(waiting, cache, 0.5, 0.5)
+        s2 = _s2_score_kernel(waiting, cache, running, 0.4, 0.3, 0.3)
+
+        for scores in (s1, s2):
+            assert isinstance(scores, np.ndarray), f"Expected ndarray for {n} members, got {type(scores)}"
+            assert scores.dtype == np.float64
+            assert scores.shape == (n,)
+
+        expected_s1 = np.clip(0.5 * (1 - waiting) + 0.5 * (1 - cache), 0.0, 1.0)
+        expected_s2 = np.clip(0.4 * (1 - waiting) + 0.3 * (1 - cache) + 0.3 * (1 - running), 0.0, 1.0)
+        assert np.allclose(s1, expected_s1)
+        assert np.allclose(s2, expected_s2)
+
+        # Results support array operations regardless of size
+        assert np.array_equal(s1.copy(), s1)
+
+    print("✓ Score kernel result type test passed")
+
+
+def test_two_value_normalize_with_nan_matches_larger_pools():
+    """A NaN in a two-member pool is handled like in larger pools instead of deciding the 0/1 split"""
+    print("\nTesting two-value normalization with NaN...")
+
+    calculator = ScoreCalculator()
+    nan = float("nan")
+    for normalize in (calculator._min_max_normalize, calculator._smooth_normalize,
+                      calculator._precise_running_normalize):
+        for pair in ([30.0, nan], [nan, 30.0]):
+            result = np.asarray(normalize(pair), dtype=np.float64)
+            larger = np.asarray(normalize(pair + [5.0]), dtype=np.float64)
+            assert not np.isfinite(result).any(), f"{normalize.__name__}{pair} returned {result}"
+            assert not np.isfinite(larger).any()
+
+    # End to end: both members of the pair keep their original scores, no member wins on position
+    members = [_make_member("10.0.0.1", 30.0, 0.2), _make_member("10.0.0.2", nan, 0.4)]
+    for member, original in zip(members, (0.3, 0.7)):
+        member.score = original
+    pool = Pool("nan-pool", "Common", EngineType.VLLM, members)
+    calculator.calculate_pool_scores(pool, ModeConfig(name="s1", w_a=0.5, w_b=0.5))
+    assert [member.score for member in members] == [0.3, 0.7]
+
+    print("✓ Two-value normalization with NaN test passed")
+
+
+def test_member_metrics_are_read_only():
+    """In-place metric edits fail loudly; only whole-dict assignment refreshes the scoring record"""
+    print("\nTesting member metrics immutability...")
+
+    member = PoolMember("10.0.0.1", 8001, "Common")
+    source = {"waiting_queue": 1.0, "cache_usage": 0.2, "running_req": 3.0}
+    member.metrics = source
+    stamp = member.metrics_stamp
+
+    try:
+        member.metrics["cache_usage"] = 0.9
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("In-place metrics edit should raise TypeError")
+
+    # The caller's dict is copied, so mutating it afterwards does not leak in
+    source["cache_usage"] = 0.9
+    assert member.metrics["cache_usage"] == 0.2
+    assert member.metrics_record.cache_usage == 0.2
+    assert member.metrics_stamp == stamp
+
+    # Whole-dict assignment refreshes record and stamp
+    member.metrics = {**member.metrics, "cache_usage": 0.5}
+    assert member.metrics_record.cache_usage == 0.5
+    assert member.metrics_stamp != stamp
+
+    print("✓ Member metrics immutability test passed")
+
+
+def test_relative_ratio_normalize_matches_log_ratio():
+    """Relative ratio normalization returns log(v / min) / log(max_ratio) and rejects non-positive ratios"""
+    print("\nTesting relative ratio normalization...")
+
+    calculator = ScoreCalculator()
+    values = [2.0, 4.0, 16.0]
+    expected = [math.log(v / 2.0) / math.log(8.0) for v in values]
+    assert np.allclose(calculator._relative_ratio_normalize(values), expected)
+
+    # Zero min is replaced by the smallest positive value, leaving a zero ratio: no log exists
+    try:
+        calculator._relative_ratio_normalize([0.0, 0.5, 2.0])
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Expected ValueError for a zero value")
+
+    print("✓ Relative ratio normalization test passed")
+
+
+def _make_member(ip, waiting, cache):
+    member = PoolMember(ip, 8001, "Common")
+    member.metrics = {"waiting_queue": waiting, "cache_usage": cache, "running_req": 1.0}
+    return member
+
+
+def test_metrics_cache_invalidation():
+    """Replacing a member's metrics or swapping a member object must miss the collected-metrics cache"""
+    print("\nTesting collected metrics cache invalidation...")
+
+    calculator = ScoreCalculator()
+    mode_config = ModeConfig(name="s1", w_a=0.5, w_b=0.5)
+    members = [_make_member("10.0.0.1", 0.0, 0.2), _make_member("10.0.0.2", 4.0, 0.4), _make_member("10.0.0.3", 8.0, 0.6)]
+    pool = Pool("cache-pool", "Common", EngineType.VLLM, members)
+
+    calculator.calculate_pool_scores(pool, mode_config)
+    first_scores = [member.score for member in members]
+
+    # Unchanged input is served from the cache and scores stay the same
+    calculator.calculate_pool_scores(pool, mode_config)
+    assert [member.score for member in members] == first_scores
+
+    # Replace one member's metrics dict: member 0 becomes the most loaded
+    members[0].metrics = {"waiting_queue": 8.0, "cache_usage": 0.9, "running_req": 1.0}
+    calculator.calculate_pool_scores(pool, mode_config)
+    assert members[0].score < first_scores[0], "New metrics of an existing member were not picked up"
+    assert members[0].score < members[2].score
+
+    # Swap a member object for a new one with different metrics
+    replacement = _make_member("10.0.0.4", 0.0, 0.0)
+    pool.members[1] = replacement
+    calculator.calculate_pool_scores(pool, mode_config)
+    assert replacement.score == max(member.score for member in pool.members), "Swapped-in member was not scored"
+    assert replacement.score > first_scores[1]
+
+    print("✓ Collected metrics cache invalidation test passed")
+
+
+def test_metrics_cache_hit_after_identical_collection():
+    """A collection tick that reassigns every member's metrics with equal values reuses the cached arrays"""
+    print("\nTesting collected metrics cache across collection ticks...")
+
+    calculator = ScoreCalculator()
+    members = [_make_member("10.0.0.1", 0.0, 0.2), _make_member("10.0.0.2", 4.0, 0.4), _make_member("10.0.0.3", 8.0, 0.6)]
+    pool = Pool("tick-pool", "Common", EngineType.VLLM, members)
+    keys = ("waiting_queue", "cache_usage")
+
+    _, first_arrays = calculator._collect_metrics(pool, keys)
+
+    # What MetricsCollector.collect_pool_metrics does on every tick: assign freshly parsed dicts
+    stamps = [member.metrics_stamp for member in members]
+    for member in members:
+        member.metrics = dict(member.metrics)
+    assert [member.metrics_stamp for member in members] == stamps
+    _, second_arrays = calculator._collect_metrics(pool, keys)
+    assert second_arrays is first_arrays, "Identical re-collection should hit the cache"
+
+    # One changed value on the next tick misses
+    members[2].metrics = {**members[2].metrics, "waiting_queue": 9.0}
+    _, third_arrays = calculator._collect_metrics(pool, keys)
+    assert third_arrays is not first_arrays
+    assert third_arrays[0][2] == 9.0
+
+    print("✓ Collected metrics cache across collection ticks test passed")
+
+
+def test_prune_pools_releases_state():
+    """Per-pool caches and buffers are dropped once their Pool is gone"""
+    print("\nTesting per-pool state pruning...")
+
+    calculator = ScoreCalculator()
+    mode_config = ModeConfig(name="s1", w_a=0.5, w_b=0.5)
+    pools = [
+        Pool(f"prune-pool-{i}", "Common", EngineType.VLLM,
+             [_make_member(f"10.0.{i}.{j}", float(j), 0.1 * j) for j in range(4)])
+        for i in range(2)
+    ]
+    for pool in pools:
+        calculator.calculate_pool_scores(pool, mode_config)
+
+    def pool_keys(cache):
+        return {key[:2] for key in cache}
+
+    assert pool_keys(calculator._metrics_cache) == {pool.get_pool_key() for pool in pools}
+    assert pool_keys(calculator._buffers) == {pool.get_pool_key() for pool in pools}
+
+    calculator.prune_pools({pools[1].get_pool_key()})
+    assert pool_keys(calculator._metrics_cache) == {pools[1].get_pool_key()}
+    assert pool_keys(calculator._buffers) == {pools[1].get_pool_key()}
+
+    print("✓ Per-pool state pruning test passed")
+
+
+class _ListHandler(logging.Handler):
+    """Collects (level, message) of emitted records"""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append((record.levelno, record.getMessage()))
+
+
+def test_normalize_cache_hit_returns_copies_and_replays_logs():
+    """A normalize cache hit returns private copies and replays the DEBUG records of the original computation"""
+    print("\nTesting adaptive distribution normalize cache...")
+
+    scheduler_logger = get_logger()
+    previous_level = scheduler_logger.log_level
+    handler = _ListHandler()
+    scheduler_logger.set_log_level(LogLevel.DEBUG)
+    scheduler_logger.logger.addHandler(handler)
+    try:
+        calculator = ScoreCalculator()
+        rows = [[1.0, 5.0, 10.0, 3.0], [0.1, 0.5, 0.9, 0.2]]
+        metric_types = ["waiting_queue", "cache_usage"]
+
+        first = calculator._adaptive_distribution_normalize_rows(rows, metric_types)
+        first_values = [row.copy() for row in first]
+        first_records = list(handler.records)
+        assert len(calculator._normalize_cache) == 1
+        assert any(level == logging.DEBUG for level, _ in first_records), "Expected DEBUG records from computation"
+
+        # Mutating the returned arrays must not reach the cached result
+        for row in first:
+            row[:] = 99.0
+
+        handler.records.clear()
+        second = calculator._adaptive_distribution_normalize_rows(rows, metric_types)
+        assert len(calculator._normalize_cache) == 1, "Identical input should hit the cache"
+        for row, expected in zip(second, first_values):
+            assert np.array_equal(row, expected)
+            assert row.flags.writeable
+        cached_results, _ = next(iter(calculator._normalize_cache.values()))
+        for row, cached in zip(second, cached_results):
+            assert not np.shares_memory(row, cached)
+        assert handler.records == first_records, "Cache hit should replay the original log records"
+    finally:
+        scheduler_logger.logger.removeHandler(handler)
+        scheduler_logger.set_log_level(previous_level)
+
+    print("✓ Adaptive distribution normalize cache test passed")
+
+
+def test_normalize_cache_concurrent_use():
+    """Scoring from several threads with eviction in progress must not corrupt the shared LRU"""
+    print("\nTesting normalize cache under concurrent use...")
+
+    class SmallCacheCalculator(ScoreCalculator):
+        _NORMALIZE_CACHE_SIZE = 4
+
+    calculator = SmallCacheCalculator()
+    inputs = [[[float(i), float(i + j + 1), float(2 * i + 3)]] for i in range(12) for j in range(2)]
+    errors = []
+
+    def worker(offset):
+        try:
+            for k in range(300):
+                rows = inputs[(offset + k) % len(inputs)]
+                calculator._adaptive_distribution_normalize_rows(rows, ["general"])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors, f"Concurrent cache use raised: {errors[:3]}"
+    assert len(calculator._normalize_cache) <= SmallCacheCalculator._NORMALIZE_CACHE_SIZE
+
+    print("✓ Normalize cache concurrency test passed")
+
+
+if __name__ == "__main__":
+    test_score_kernels_return_arrays_for_all_pool_sizes()
+    test_two_value_normalize_with_nan_matches_larger_pools()
+    test_member_metrics_are_read_only()
+    test_relative_ratio_normalize_matches_log_ratio()
+    test_metrics_cache_invalidation()
+    test_metrics_cache_hit_after_identical_collection()
+    test_prune_pools_releases_state()
+    test_normalize_cache_hit_returns_copies_and_replays_logs()
+    test_normalize_cache_concurrent_use()
+    print("\n✅ All score calculator cache tests passed successfully!")
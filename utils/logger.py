@@ -117,6 +117,13 @@ class SchedulerLogger:
         self.debug_enabled = debug
         self._update_handler_levels()
     
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether messages at the given logging level would be emitted
+        
+        Lets callers skip building expensive debug messages entirely.
+        """
+        return self.logger is not None and self.logger.isEnabledFor(level)
+    
     def debug(self, message: str):
         """Debug level log"""
         if self.logger: